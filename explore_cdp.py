@@ -1,14 +1,24 @@
 import requests
 import json
+import socket
 import websocket
 import time
 
+# CDP request payloads are constant; build them once instead of
+# re-encoding the same dict on every send.
+GET_TARGETS = json.dumps({"id": 1, "method": "Target.getTargets"})
+GET_PROCESS_INFO = json.dumps({"id": 2, "method": "SystemInfo.getProcessInfo"})
+
 def explore():
     try:
+        # One session for both HTTP endpoints: keep-alive reuses the TCP
+        # connection to the debugger instead of reconnecting per request.
+        sess = requests.Session()
+
         # 1. /json/list
         print("--- /json/list ---")
         try:
-            resp = requests.get('http://localhost:9222/json/list', timeout=2)
+            resp = sess.get('http://localhost:9222/json/list', timeout=2)
             targets = resp.json()
             if targets:
                 print(f"Found {len(targets)} targets.")
@@ -25,7 +35,7 @@ def explore():
         # 2. /json/version
         print("\n--- /json/version ---")
         try:
-            resp = requests.get('http://localhost:9222/json/version', timeout=2)
+            resp = sess.get('http://localhost:9222/json/version', timeout=2)
             version = resp.json()
             print("Browser WS:", version.get('webSocketDebuggerUrl'))
             
@@ -33,20 +43,33 @@ def explore():
             
             if browser_ws:
                 ws = websocket.create_connection(browser_ws)
-                
+                # TCP_NODELAY: don't let Nagle hold back small JSON frames
+                # (up to 40ms per message). SO_KEEPALIVE keeps the socket
+                # alive through proxies if the connection is held open.
+                ws.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                ws.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+
+                # Pipeline both CDP requests over the one socket, then
+                # match responses by id — saves a full send/recv RTT.
+                ws.send(GET_TARGETS)
+                ws.send(GET_PROCESS_INFO)
+                responses = {}
+                for _ in range(2):
+                    msg = json.loads(ws.recv())
+                    responses[msg.get('id')] = msg
+
                 # 3. Target.getTargets
                 print("\n--- Target.getTargets ---")
-                ws.send(json.dumps({"id": 1, "method": "Target.getTargets"}))
-                res = json.loads(ws.recv())
+                res = responses.get(1, {})
                 if 'result' in res:
                     t_infos = res['result']['targetInfos']
                     if t_infos:
                         print("First TargetInfo:", t_infos[0])
-                
+
                 # 4. SystemInfo.getProcessInfo
                 print("\n--- SystemInfo.getProcessInfo ---")
-                ws.send(json.dumps({"id": 2, "method": "SystemInfo.getProcessInfo"}))
-                res = json.loads(ws.recv())
+                res = responses.get(2, {})
                 if 'result' in res and 'processInfo' in res['result']:
                     infos = res['result']['processInfo']
                     print(f"Total processInfo entries: {len(infos)}")
@@ -25,17 +25,18 @@ def collect_processes():
     chrome_procs = []
     gpu_procs = []
 
-    for p in psutil.process_iter(["pid", "name", "cmdline", "memory_info"]):
+    # 只预取 pid/name：cmdline 在 macOS 上要走 libproc，开销大。
+    # 先按名字过滤，只对少数 Chrome 进程再取 cmdline / memory_info。
+    for p in psutil.process_iter(["pid", "name"]):
         try:
             name = p.info["name"] or ""
-            cmdline = p.info["cmdline"] or []
-            mem = p.info["memory_info"]
+            if not is_chrome_process(name):
+                continue
+            cmdline = p.cmdline() or []
+            mem = p.memory_info()
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             continue
 
-        if not is_chrome_process(name):
-            continue
-
         # 所有 Chrome 相关进程
         chrome_procs.append((p, mem))
 
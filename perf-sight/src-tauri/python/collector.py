@@ -1,16 +1,53 @@
+import os
 import sys
 import json
 import time
+import operator
 import psutil
 import threading
 
-# Global state
-config = {
-    "running": False,
-    "pids": [],
-    "interval": 1.0
-}
-config_lock = threading.Lock()
+# orjson encodes straight to bytes with SIMD acceleration; fall back to
+# the stdlib encoder if it is not available in the build environment.
+try:
+    import orjson
+
+    def json_dumps(obj):
+        return orjson.dumps(obj)
+
+    json_loads = orjson.loads
+except ImportError:
+    def json_dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
+    json_loads = json.loads
+
+# Raw stdout fd: os.write skips the Python IO object (lock, buffer)
+# entirely.
+STDOUT_FD = sys.stdout.fileno()
+
+def emit_line(payload):
+    """Write one NDJSON line to stdout, looping on short writes.
+
+    os.write can write fewer bytes than asked (signal interruption, pipe
+    capacity), and pipe atomicity only holds up to PIPE_BUF (~4 KB) —
+    a process_list scan payload routinely exceeds that. A short write
+    left unhandled would truncate mid-line and corrupt the stream the
+    Rust side parses.
+    """
+    view = memoryview(payload)
+    while view:
+        n = os.write(STDOUT_FD, view)
+        view = view[n:]
+
+# Global state: one immutable (running, pids, interval) snapshot.
+# The stdin thread publishes a whole new tuple on every command; the
+# collector thread reads the name without a lock — a global read is a
+# single atomic operation under the GIL, so no torn state is possible.
+current_config = (False, frozenset(), 1.0)
+
+# Wakes the collection loop as soon as a command changes config, instead
+# of letting it sleep out the remainder of the interval.
+wake_event = threading.Event()
 
 def get_cpu_count():
     try:
@@ -18,74 +55,220 @@ def get_cpu_count():
     except:
         return 1
 
+# Which memory_info field we report is fixed per platform (Windows pmem
+# has 'private' / Commit Size, elsewhere rss), so resolve the accessor
+# once instead of a getattr-with-default per pid per tick.
+try:
+    if hasattr(psutil._psplatform.pmem, 'private'):
+        mem_field = operator.attrgetter('private')
+    else:
+        mem_field = operator.attrgetter('rss')
+except AttributeError:
+    mem_field = operator.attrgetter('rss')
+
 CPU_COUNT = get_cpu_count()
 IS_DARWIN = sys.platform == "darwin"
 
+# CPU% reporting differs by OS UI conventions:
+# - Windows Task Manager: typically normalized to total CPU capacity (0-100%)
+# - macOS Activity Monitor: typically sums per-core usage (can exceed 100%)
+#
+# So:
+# - On macOS, do NOT divide by CPU_COUNT (match Activity Monitor).
+# - On Windows/Linux, divide by CPU_COUNT (match Task Manager style).
+# Folded into one multiply-by-constant for the hot loop.
+CPU_SCALE = 100.0 if IS_DARWIN else 100.0 / CPU_COUNT
+MB_SCALE = 1.0 / (1024 * 1024)
+IS_LINUX = sys.platform.startswith("linux")
+IS_WINDOWS = sys.platform == "win32"
+
+if IS_LINUX:
+    CLK_TCK = os.sysconf('SC_CLK_TCK')
+    PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
+
+if IS_WINDOWS:
+    # Direct GetProcessMemoryInfo via ctypes: we only need PrivateUsage,
+    # so skip psutil's full memory_info namedtuple build per pid per tick.
+    import ctypes
+    from ctypes import wintypes
+
+    PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+
+    class PROCESS_MEMORY_COUNTERS_EX(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+            ("PrivateUsage", ctypes.c_size_t),
+        ]
+
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    _psapi = ctypes.WinDLL('psapi', use_last_error=True)
+
+    def open_proc_handle(pid):
+        """Open a query-only handle once; reused across ticks."""
+        handle = _kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        return handle or None
+
+    def close_proc_handle(handle):
+        _kernel32.CloseHandle(handle)
+
+    def read_private_usage(handle):
+        """PrivateUsage (Commit Size) for an open handle, or None."""
+        counters = PROCESS_MEMORY_COUNTERS_EX()
+        counters.cb = ctypes.sizeof(counters)
+        if _psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+            return counters.PrivateUsage
+        return None
+
+
+def open_proc_files(pid):
+    """Open /proc/<pid>/{stat,statm} once so each tick is a single pread."""
+    try:
+        return (os.open(f"/proc/{pid}/stat", os.O_RDONLY),
+                os.open(f"/proc/{pid}/statm", os.O_RDONLY))
+    except OSError:
+        return None
+
+
+def close_proc_files(fds):
+    for fd in fds:
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+
+# Chrome --type= values mapped to display categories; anything else is
+# shown capitalized as-is.
+CHROME_TYPE_NAMES = {
+    'gpu-process': 'GPU',
+    'utility': 'Utility',
+    'crashpad-handler': 'Crashpad',
+}
+
+# Process objects cache for scan_chrome_processes.
+# Keeping Process objects alive across scans means only newly-seen PIDs
+# pay the construction cost (which reads create_time from the OS). What
+# is cached per object varies by platform: name() only on Windows,
+# cmdline() never — those still hit the OS on every scan.
+scan_cache = {}
+
 def collect_metrics():
     """Main collection loop running in a separate thread."""
     
     # Process objects cache
     process_cache = {}
-    
+
     # CPU calculation cache: pid -> (last_time, last_total_cpu_time)
     cpu_state = {}
 
+    # Linux fast path: pid -> (stat_fd, statm_fd), read with os.pread each
+    # tick instead of going through psutil's /proc parsing.
+    proc_files = {}
+
+    # Windows fast path: pid -> process handle for GetProcessMemoryInfo.
+    proc_handles = {}
+
     while True:
-        with config_lock:
-            running = config["running"]
-            target_pids = list(config["pids"])
-            interval = config["interval"]
+        running, target_pid_set, interval = current_config
 
         if not running:
             # Clear caches to avoid stale data on resume
-            if not target_pids:
+            if not target_pid_set:
                 process_cache.clear()
                 cpu_state.clear()
-            time.sleep(0.1)
+                for fds in proc_files.values():
+                    close_proc_files(fds)
+                proc_files.clear()
+                for handle in proc_handles.values():
+                    close_proc_handle(handle)
+                proc_handles.clear()
+            if wake_event.wait(0.1):
+                wake_event.clear()
             continue
 
-        # Cleanup caches
-        target_pid_set = set(target_pids)
-        for pid in list(process_cache.keys()):
-            if pid not in target_pid_set:
-                del process_cache[pid]
-        for pid in list(cpu_state.keys()):
-            if pid not in target_pid_set:
-                del cpu_state[pid]
+        # Cleanup caches: one shared set-difference pass, no key-list
+        # materialization per tick.
+        stale = (process_cache.keys() | cpu_state.keys() | proc_files.keys()
+                 | proc_handles.keys()) - target_pid_set
+        for pid in stale:
+            process_cache.pop(pid, None)
+            cpu_state.pop(pid, None)
+            fds = proc_files.pop(pid, None)
+            if fds:
+                close_proc_files(fds)
+            handle = proc_handles.pop(pid, None)
+            if handle:
+                close_proc_handle(handle)
 
         timestamp = int(time.time() * 1000)
-        now = time.time()
-        metrics = {}
-        has_data = False
+        # Monotonic clock for the delta math: immune to NTP/DST jumps that
+        # would otherwise produce negative or inflated CPU deltas.
+        now = time.monotonic()
+        # SoA payload: three aligned arrays instead of a dict-per-pid, so
+        # neither side allocates a nested object per process per tick.
+        out_pids = []
+        out_cpu = []
+        out_mem = []
 
-        for pid in target_pids:
+        for pid in target_pid_set:
             try:
                 if pid not in process_cache:
                     process_cache[pid] = psutil.Process(pid)
-                
+                    if IS_LINUX:
+                        fds = open_proc_files(pid)
+                        if fds:
+                            proc_files[pid] = fds
+                    elif IS_WINDOWS:
+                        handle = open_proc_handle(pid)
+                        if handle:
+                            proc_handles[pid] = handle
+
                 proc = process_cache[pid]
 
+                # --- Linux fast path ---
+                # One pread on /proc/<pid>/stat for utime/stime and one on
+                # statm for RSS, instead of psutil's full attribute parse.
+                total_cpu_time = None
+                private_mem = None
+                if pid in proc_files:
+                    try:
+                        stat_fd, statm_fd = proc_files[pid]
+                        stat = os.pread(stat_fd, 512, 0)
+                        # Fields after the ')' of comm: utime/stime are
+                        # stat fields 14/15 (index 11/12 after comm).
+                        fields = stat[stat.rindex(b')') + 2:].split()
+                        total_cpu_time = (int(fields[11]) + int(fields[12])) / CLK_TCK
+                        statm = os.pread(statm_fd, 128, 0)
+                        private_mem = int(statm.split()[1]) * PAGE_SIZE
+                    except (OSError, ValueError, IndexError):
+                        # Process likely died; fall back to psutil below.
+                        close_proc_files(proc_files.pop(pid))
+                        total_cpu_time = None
+                        private_mem = None
+
                 # --- Manual CPU Calculation (Manual Delta) ---
                 # This bypasses psutil's internal state which might be finicky with interval=None
                 try:
-                    cpu_times = proc.cpu_times()
-                    total_cpu_time = cpu_times.user + cpu_times.system
-                    
+                    if total_cpu_time is None:
+                        cpu_times = proc.cpu_times()
+                        total_cpu_time = cpu_times.user + cpu_times.system
+
                     if pid in cpu_state:
                         last_time, last_total = cpu_state[pid]
                         delta_time = now - last_time
                         delta_cpu = total_cpu_time - last_total
                         
                         if delta_time > 0 and delta_cpu >= 0:
-                            # CPU% reporting differs by OS UI conventions:
-                            # - Windows Task Manager: typically normalized to total CPU capacity (0-100%)
-                            # - macOS Activity Monitor: typically sums per-core usage (can exceed 100%)
-                            #
-                            # So:
-                            # - On macOS, do NOT divide by CPU_COUNT (match Activity Monitor).
-                            # - On Windows/Linux, divide by CPU_COUNT (match Task Manager style).
-                            cpu_raw = (delta_cpu / delta_time) * 100
-                            cpu = cpu_raw if IS_DARWIN else (cpu_raw / CPU_COUNT)
+                            # See CPU_SCALE for the per-OS normalization.
+                            cpu = (delta_cpu / delta_time) * CPU_SCALE
                         else:
                             cpu = 0.0
                     else:
@@ -104,129 +287,153 @@ def collect_metrics():
 
                 # --- Memory Logic ---
                 # User confirmed 'private' matches Chrome Task Manager best
-                mem_info = proc.memory_info()
-                # Windows: private (Commit Size), Linux/Mac: fallback to rss
-                private_mem = getattr(mem_info, 'private', mem_info.rss)
-                mem_mb = private_mem / 1024 / 1024
+                if private_mem is None and pid in proc_handles:
+                    private_mem = read_private_usage(proc_handles[pid])
+                if private_mem is None:
+                    private_mem = mem_field(proc.memory_info())
+                mem_mb = private_mem * MB_SCALE
                 
                 # Log only if > 0 to reduce spam, or periodic? 
                 # sys.stderr.write(f"PID={pid} CPU={cpu:.2f}% Mem={mem_mb:.2f}MB\n")
                 
-                metrics[pid] = {
-                    "cpu": round(cpu, 2),
-                    "memory": round(mem_mb, 2),
-                }
-                has_data = True
-                
+                out_pids.append(pid)
+                out_cpu.append(round(cpu, 2))
+                out_mem.append(round(mem_mb, 2))
+
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                metrics[pid] = None
+                # Dead/inaccessible pids are simply omitted from the arrays
                 if pid in process_cache: del process_cache[pid]
                 if pid in cpu_state: del cpu_state[pid]
+                if pid in proc_files: close_proc_files(proc_files.pop(pid))
+                if pid in proc_handles: close_proc_handle(proc_handles.pop(pid))
             except Exception as e:
                 sys.stderr.write(f"PID={pid} Error: {e}\n")
-                metrics[pid] = None
 
-        if has_data:
+        if out_pids:
             output = {
                 "type": "data",
                 "timestamp": timestamp,
-                "metrics": metrics
+                "pids": out_pids,
+                "cpu": out_cpu,
+                "memory": out_mem
             }
             try:
-                sys.stdout.write(json.dumps(output) + "\n")
-                sys.stdout.flush()
+                emit_line(json_dumps(output) + b"\n")
             except Exception:
                 break
 
-        time.sleep(interval)
+        if wake_event.wait(interval):
+            wake_event.clear()
 
 def scan_chrome_processes():
     """Scan for all Chrome processes and categorize them."""
     chrome_procs = []
-    target_names = ['chrome.exe', 'google chrome', 'chrome']
-    
-    for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'memory_info']):
+
+    # Refresh cache against live PIDs: evict dead processes, only pay
+    # Process() construction for PIDs we have not seen before.
+    current = set(psutil.pids())
+    for pid in list(scan_cache.keys()):
+        if pid not in current:
+            del scan_cache[pid]
+
+    for pid in current:
         try:
-            name = proc.info['name'].lower()
-            if any(t in name for t in target_names):
-                cmdline = proc.info.get('cmdline') or []
-                cmd_str = ' '.join(cmdline)
-                
+            proc = scan_cache.get(pid)
+            # A recycled PID must not inherit the old entry's attributes:
+            # is_running() compares the stored create_time against the live
+            # process — the same identity check psutil.process_iter performs
+            # on its own internal cache.
+            if proc is None or not proc.is_running():
+                proc = psutil.Process(pid)
+                scan_cache[pid] = proc
+
+            proc_name = proc.name()
+            # 'chrome' is a substring of every target name we care about
+            # (chrome.exe, Google Chrome, chrome), so one scan suffices.
+            if 'chrome' in proc_name.lower():
+                cmdline = proc.cmdline() or []
+
+                # Single pass over the args: find the one --type= flag and
+                # dispatch on its value, no joined string / substring scans.
+                # Plain loop rather than a genexpr: no generator frame
+                # allocated per process.
                 proc_type = "Browser"
-                if '--type=renderer' in cmd_str:
-                    if '--extension-process' in cmd_str:
-                        proc_type = "Extension"
+                type_val = None
+                for arg in cmdline:
+                    if arg.startswith('--type='):
+                        type_val = arg[7:]
+                        break
+                if type_val is not None:
+                    if type_val == 'renderer':
+                        if '--extension-process' in cmdline:
+                            proc_type = "Extension"
+                        else:
+                            proc_type = "Renderer"
                     else:
-                        proc_type = "Renderer"
-                elif '--type=gpu-process' in cmd_str:
-                    proc_type = "GPU"
-                elif '--type=utility' in cmd_str:
-                    proc_type = "Utility"
-                elif '--type=crashpad-handler' in cmd_str:
-                    proc_type = "Crashpad"
-                elif '--type=' in cmd_str:
-                    for arg in cmdline:
-                        if arg.startswith('--type='):
-                            proc_type = arg.split('=')[1].capitalize()
-                            break
-                            
+                        proc_type = CHROME_TYPE_NAMES.get(type_val) or type_val.capitalize()
+
                 # Use 'private' memory here too for consistency
-                mem_info = proc.info['memory_info']
-                mem = getattr(mem_info, 'private', mem_info.rss)
-                
+                mem = mem_field(proc.memory_info())
+
                 chrome_procs.append({
-                    "pid": proc.info['pid'],
-                    "name": proc.info['name'],
-                    "proc_type": proc_type, 
+                    "pid": pid,
+                    "name": proc_name,
+                    "proc_type": proc_type,
                     "memory": mem,
                     "cpu": 0.0
                 })
         except (psutil.NoSuchProcess, psutil.AccessDenied):
-            pass
-            
+            scan_cache.pop(pid, None)
+
     return chrome_procs
 
 def read_stdin():
-    """Read commands from stdin."""
+    """Read commands from stdin. Sole writer of current_config."""
+    global current_config
+
     for line in sys.stdin:
         try:
             line = line.strip()
             if not line:
                 continue
-                
-            cmd = json.loads(line)
+
+            cmd = json_loads(line)
             action = cmd.get("action")
-            
-            with config_lock:
-                if action == "scan_chrome":
-                    procs = scan_chrome_processes()
-                    output = {"type": "process_list", "data": procs}
-                    sys.stdout.write(json.dumps(output) + "\n")
-                    sys.stdout.flush()
-                    
-                elif action == "start":
-                    config["pids"] = cmd.get("pids", [])
-                    interval = cmd.get("interval", 1.0)
-                    config["interval"] = max(0.5, interval)
-                    config["running"] = True
-                    sys.stderr.write(f"Python: Started collection for pids: {config['pids']}\n")
-                    sys.stderr.flush()
-                    
-                elif action == "stop":
-                    config["running"] = False
-                    sys.stderr.write("Python: Stopped collection\n")
-                    sys.stderr.flush()
-                    
-                elif action == "update":
-                    if "pids" in cmd:
-                        config["pids"] = cmd["pids"]
-                    if "interval" in cmd:
-                        config["interval"] = max(0.5, cmd["interval"])
-                        
-                elif action == "exit":
-                    sys.exit(0)
-                    
-        except json.JSONDecodeError:
+
+            if action == "scan_chrome":
+                procs = scan_chrome_processes()
+                output = {"type": "process_list", "data": procs}
+                emit_line(json_dumps(output) + b"\n")
+
+            elif action == "start":
+                pids = frozenset(cmd.get("pids", []))
+                interval = max(0.5, cmd.get("interval", 1.0))
+                current_config = (True, pids, interval)
+                wake_event.set()
+                sys.stderr.write(f"Python: Started collection for pids: {sorted(pids)}\n")
+                sys.stderr.flush()
+
+            elif action == "stop":
+                running, pids, interval = current_config
+                current_config = (False, pids, interval)
+                wake_event.set()
+                sys.stderr.write("Python: Stopped collection\n")
+                sys.stderr.flush()
+
+            elif action == "update":
+                running, pids, interval = current_config
+                if "pids" in cmd:
+                    pids = frozenset(cmd["pids"])
+                if "interval" in cmd:
+                    interval = max(0.5, cmd["interval"])
+                current_config = (running, pids, interval)
+                wake_event.set()
+
+            elif action == "exit":
+                sys.exit(0)
+
+        except ValueError:
+            # Covers both json.JSONDecodeError and orjson.JSONDecodeError
             pass
         except Exception as e:
             sys.stderr.write(f"Python Error: {e}\n")
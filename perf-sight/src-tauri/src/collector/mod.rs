@@ -7,6 +7,172 @@ use sysinfo::{Pid, System};
 use std::collections::HashMap;
 use std::time::Instant;
 
+// Linux fast path: one read of /proc/<pid>/stat (CPU jiffies) plus one of
+// /proc/<pid>/statm (resident pages) per sample, instead of letting sysinfo
+// re-walk every /proc entry on each refresh.
+#[cfg(target_os = "linux")]
+mod procfs {
+    use std::sync::OnceLock;
+
+    pub fn clk_tck() -> f64 {
+        static V: OnceLock<f64> = OnceLock::new();
+        *V.get_or_init(|| unsafe { libc::sysconf(libc::_SC_CLK_TCK) } as f64)
+    }
+
+    pub fn page_size() -> u64 {
+        static V: OnceLock<u64> = OnceLock::new();
+        *V.get_or_init(|| unsafe { libc::sysconf(libc::_SC_PAGESIZE) } as u64)
+    }
+
+    /// Read `path` into a reused scratch buffer (cleared, not reallocated),
+    /// so the steady-state sampling loop does no heap allocation per file.
+    pub fn read_file_into(path: &str, buf: &mut Vec<u8>) -> bool {
+        use std::io::Read;
+        buf.clear();
+        match std::fs::File::open(path) {
+            Ok(mut f) => f.read_to_end(buf).is_ok(),
+            Err(_) => false,
+        }
+    }
+
+    /// pread a cached /proc fd from offset 0 into a reused buffer. procfs
+    /// regenerates the content on every read, so a handle opened once stays
+    /// valid for the process's lifetime and each sample is a single syscall.
+    pub fn pread_into(file: &std::fs::File, buf: &mut Vec<u8>) -> bool {
+        use std::os::unix::fs::FileExt;
+        buf.resize(4096, 0);
+        match file.read_at(buf, 0) {
+            // A live /proc file is never empty; 0 bytes means the process
+            // exited, so report it like a read error and let the caller
+            // drop the stale handle.
+            Ok(n) if n > 0 => {
+                buf.truncate(n);
+                true
+            }
+            _ => false,
+        }
+    }
+
+    fn parse_u64(s: &[u8]) -> Option<u64> {
+        if s.is_empty() {
+            return None;
+        }
+        let mut v: u64 = 0;
+        for &b in s {
+            if !b.is_ascii_digit() {
+                return None;
+            }
+            v = v.checked_mul(10)?.checked_add((b - b'0') as u64)?;
+        }
+        Some(v)
+    }
+
+    /// utime + stime (fields 14/15) from a /proc/<pid>/stat buffer. The comm
+    /// field can contain spaces and parentheses, so split after the LAST ')'
+    /// (memrchr) instead of naively on whitespace; the fixed fields are then
+    /// located by jumping a SIMD space-finder to the Nth separator rather
+    /// than materializing every intermediate field.
+    pub fn parse_stat_jiffies(buf: &[u8]) -> Option<u64> {
+        let close = memchr::memrchr(b')', buf)?;
+        let rest = buf.get(close + 2..)?;
+        // `rest` starts at field 3 (state); utime/stime are fields 14/15,
+        // i.e. the byte ranges bounded by its 11th..13th spaces.
+        let mut spaces = memchr::memchr_iter(b' ', rest);
+        let utime_start = spaces.nth(10)? + 1;
+        let utime_end = spaces.next()?;
+        let stime_end = spaces.next().unwrap_or(rest.len());
+        let utime = parse_u64(rest.get(utime_start..utime_end)?)?;
+        let stime = parse_u64(rest.get(utime_end + 1..stime_end)?)?;
+        Some(utime + stime)
+    }
+
+    /// RSS in bytes from a /proc/<pid>/statm buffer (field 2 is resident pages).
+    pub fn parse_statm_rss(buf: &[u8]) -> Option<u64> {
+        let first = memchr::memchr(b' ', buf)?;
+        let rest = buf.get(first + 1..)?;
+        let end = memchr::memchr(b' ', rest).unwrap_or(rest.len());
+        let pages = parse_u64(rest.get(..end)?)?;
+        Some(pages * page_size())
+    }
+
+    /// Convenience wrappers for one-off callers (scan path); the sampling
+    /// loop reads through its own scratch buffers instead.
+    pub fn read_statm_rss(pid: u32) -> Option<u64> {
+        let mut buf = Vec::with_capacity(256);
+        if !read_file_into(&format!("/proc/{}/statm", pid), &mut buf) {
+            return None;
+        }
+        parse_statm_rss(&buf)
+    }
+}
+
+// Parallel browser-process scan over /proc: each pid needs only comm (name
+// filter), cmdline (--type= detection) and statm (RSS), and the reads are
+// independent, so rayon fans them out instead of a serial sysinfo refresh
+// of every process. Callers already run this under spawn_blocking, keeping
+// rayon's pool off the tokio workers.
+#[cfg(target_os = "linux")]
+fn scan_processes_procfs() -> Vec<ProcessInfo> {
+    use rayon::prelude::*;
+
+    let Ok(dir) = std::fs::read_dir("/proc") else {
+        return Vec::new();
+    };
+    dir.par_bridge()
+        .filter_map(|entry| entry.ok())
+        .filter_map(|entry| entry.file_name().to_str()?.parse::<u32>().ok())
+        .filter_map(|pid| {
+            let comm = std::fs::read_to_string(format!("/proc/{}/comm", pid)).ok()?;
+            let name = comm.trim().to_lowercase();
+            // Match common browser executables
+            let is_chrome_like = name.contains("chrome")
+                || name.contains("edge")
+                || name.contains("safari")
+                || name.contains("firefox");
+            if !is_chrome_like {
+                return None;
+            }
+
+            // cmdline is NUL-separated argv; match the raw bytes (memmem)
+            // instead of materializing a joined String per process.
+            let cmd = std::fs::read(format!("/proc/{}/cmdline", pid)).unwrap_or_default();
+            let has = |needle: &[u8]| memchr::memmem::find(&cmd, needle).is_some();
+
+            let mut p_type = "Browser".to_string();
+            let mut title = None;
+            if has(b"--type=gpu-process") {
+                p_type = "GPU".to_string();
+                title = Some("GPU Process".to_string());
+            } else if has(b"--type=renderer") {
+                p_type = "Renderer".to_string();
+                title = Some("Renderer / Tab".to_string());
+            } else if has(b"--type=utility") {
+                p_type = "Utility".to_string();
+            }
+
+            Some(ProcessInfo {
+                pid,
+                alias: None,
+                name,
+                memory_usage: procfs::read_statm_rss(pid).unwrap_or(0),
+                // Fresh scans have no CPU delta to report (matches the
+                // sysinfo path, where a just-created System reads ~0 here).
+                cpu_usage: 0.0,
+                proc_type: p_type,
+                title,
+                url: None,
+            })
+        })
+        .collect()
+}
+
+/// Round CPU% to 0.01 precision. Display never needs more, and it keeps the
+/// serialized floats short ("12.34" instead of the raw ratio's full shortest
+/// form) on every emitted point.
+fn centi_pct(pct: f32) -> f32 {
+    (pct * 100.0).round() / 100.0
+}
+
 fn os_cpu_pct_for_task_manager(raw_sysinfo_cpu_pct: f32) -> f32 {
     // sysinfo's Process::cpu_usage() can exceed 100% on multi-core machines.
     //
@@ -18,12 +184,12 @@ fn os_cpu_pct_for_task_manager(raw_sysinfo_cpu_pct: f32) -> f32 {
         let cpu_count = std::thread::available_parallelism()
             .map(|n| n.get())
             .unwrap_or(1) as f32;
-        return raw_sysinfo_cpu_pct / cpu_count;
+        return centi_pct(raw_sysinfo_cpu_pct / cpu_count);
     }
 
     #[cfg(not(target_os = "windows"))]
     {
-        raw_sysinfo_cpu_pct
+        centi_pct(raw_sysinfo_cpu_pct)
     }
 }
 
@@ -125,6 +291,24 @@ pub struct GeneralCollector {
     prev_cpu_time: HashMap<u32, (f64, Instant)>,
     // Computed CPU% from CDP cpuTime deltas (closest to Chrome Task Manager CPU column).
     browser_cpu_pct: HashMap<u32, f32>,
+
+    // Linux /proc fast-path state: previous (jiffies, sample time) per pid
+    // plus reusable read/format scratch buffers so the steady-state loop is
+    // allocation-free. Mutex because collect_process takes &self.
+    #[cfg(target_os = "linux")]
+    linux_proc: std::sync::Mutex<LinuxProcState>,
+}
+
+#[cfg(target_os = "linux")]
+#[derive(Default)]
+struct LinuxProcState {
+    prev_jiffies: HashMap<u32, (u64, Instant)>,
+    // (stat, statm) handles opened once per pid and pread each tick;
+    // dropped when a read fails (process gone).
+    files: HashMap<u32, (std::fs::File, std::fs::File)>,
+    path_buf: String,
+    stat_buf: Vec<u8>,
+    statm_buf: Vec<u8>,
 }
 
 impl GeneralCollector {
@@ -138,6 +322,8 @@ impl GeneralCollector {
             browser_procinfo: HashMap::new(),
             prev_cpu_time: HashMap::new(),
             browser_cpu_pct: HashMap::new(),
+            #[cfg(target_os = "linux")]
+            linux_proc: std::sync::Mutex::new(LinuxProcState::default()),
         }
     }
 }
@@ -149,8 +335,14 @@ impl ResourceCollector for GeneralCollector {
         // unless processes/cpu are refreshed explicitly.
         //
         // Keep the same `System` instance and refresh at a reasonable interval (we use 1s).
-        self.system.refresh_cpu();
-        self.system.refresh_processes();
+        //
+        // On Linux, collect_process reads /proc/<pid>/{stat,statm} directly, so the
+        // per-tick full-process refresh (one walk of every /proc entry) is skipped.
+        #[cfg(not(target_os = "linux"))]
+        {
+            self.system.refresh_cpu();
+            self.system.refresh_processes();
+        }
 
         if self.mode == "browser" {
             if let Ok(map) = CdpClient::get_browser_process_info() {
@@ -172,7 +364,7 @@ impl ResourceCollector for GeneralCollector {
                             // 100% == one fully utilized core; can exceed 100% with multi-threading.
                             // Chrome Task Manager typically normalizes by total logical CPUs (percent of total CPU capacity).
                             let pct = ((dcpu / dt) * 100.0 / cpu_count).max(0.0);
-                            next_cpu.insert(*pid, pct as f32);
+                            next_cpu.insert(*pid, centi_pct(pct as f32));
                         }
                     }
                     self.prev_cpu_time.insert(*pid, (cpu_time, now));
@@ -184,6 +376,11 @@ impl ResourceCollector for GeneralCollector {
 
     fn scan_processes(&mut self, mode: &str) -> Vec<ProcessInfo> {
         if mode == "browser" {
+            // Scans are user-triggered and rare; refresh here so the per-tab
+            // memory/cpu snapshot below is current even on platforms where
+            // update() no longer refreshes processes.
+            self.system.refresh_processes();
+
             // Preload browser process info so Browser-level processes (GPU/Browser/Utility) can be selectable.
             if let Ok(map) = CdpClient::get_browser_process_info() {
                 self.browser_procinfo = map;
@@ -274,48 +471,56 @@ impl ResourceCollector for GeneralCollector {
             // If CDP fetch fails or empty, fall through to system scan (or return empty)
         } 
         
-        // System Mode: Default sysinfo logic
-        self.system.refresh_processes();
-        let mut results = Vec::new();
-        
-        for (pid, process) in self.system.processes() {
-            let name = process.name().to_lowercase();
-            // Match common browser executables
-            let is_chrome_like = name.contains("chrome") || name.contains("edge") || name.contains("safari") || name.contains("firefox");
+        // System Mode: parallel /proc walk on Linux, sysinfo elsewhere
+        #[cfg(target_os = "linux")]
+        {
+            return scan_processes_procfs();
+        }
+
+        #[cfg(not(target_os = "linux"))]
+        {
+            self.system.refresh_processes();
+            let mut results = Vec::new();
+
+            for (pid, process) in self.system.processes() {
+                let name = process.name().to_lowercase();
+                // Match common browser executables
+                let is_chrome_like = name.contains("chrome") || name.contains("edge") || name.contains("safari") || name.contains("firefox");
             
-            if is_chrome_like {
-                let cmd_args = process.cmd();
-                let args_str = cmd_args.join(" ");
+                if is_chrome_like {
+                    let cmd_args = process.cmd();
+                    let args_str = cmd_args.join(" ");
                 
-                let mut p_type = "Browser".to_string();
-                let mut title = None;
-                let url = None;
-
-                // 1. Identify Type via Args
-                if args_str.contains("--type=gpu-process") {
-                    p_type = "GPU".to_string();
-                    title = Some("GPU Process".to_string());
-                } else if args_str.contains("--type=renderer") {
-                    p_type = "Renderer".to_string();
-                    title = Some("Renderer / Tab".to_string());
-                } else if args_str.contains("--type=utility") {
-                    p_type = "Utility".to_string();
-                }
+                    let mut p_type = "Browser".to_string();
+                    let mut title = None;
+                    let url = None;
+
+                    // 1. Identify Type via Args
+                    if args_str.contains("--type=gpu-process") {
+                        p_type = "GPU".to_string();
+                        title = Some("GPU Process".to_string());
+                    } else if args_str.contains("--type=renderer") {
+                        p_type = "Renderer".to_string();
+                        title = Some("Renderer / Tab".to_string());
+                    } else if args_str.contains("--type=utility") {
+                        p_type = "Utility".to_string();
+                    }
 
-                results.push(ProcessInfo {
-                    pid: pid.as_u32(),
-                    alias: None,
-                    name: name,
-                    // sysinfo returns memory in bytes.
-                    memory_usage: process.memory(),
-                    cpu_usage: os_cpu_pct_for_task_manager(process.cpu_usage()),
-                    proc_type: p_type,
-                    title: title,
-                    url: url,
-                });
+                    results.push(ProcessInfo {
+                        pid: pid.as_u32(),
+                        alias: None,
+                        name: name,
+                        // sysinfo returns memory in bytes.
+                        memory_usage: process.memory(),
+                        cpu_usage: os_cpu_pct_for_task_manager(process.cpu_usage()),
+                        proc_type: p_type,
+                        title: title,
+                        url: url,
+                    });
+                }
             }
+            results
         }
-        results
     }
 
     fn collect_process(&self, pid: u32) -> Option<MetricPoint> {
@@ -333,8 +538,73 @@ impl ResourceCollector for GeneralCollector {
             custom_metrics: None,
         };
 
-        // 1. Get Sysinfo Metrics (if PID is likely real)
+        // 1. Get OS Metrics (if PID is likely real)
         // Virtual PIDs start at 90000
+        //
+        // Linux: two reads total (stat for jiffies, statm for RSS); CPU% is
+        // computed from the jiffy delta since the previous sample.
+        #[cfg(target_os = "linux")]
+        if pid < 90000 {
+            use std::fmt::Write as _;
+
+            let mut guard = self.linux_proc.lock().unwrap();
+            let st = &mut *guard;
+
+            // Open /proc/<pid>/{stat,statm} once per pid, then pread the
+            // cached handles every tick (the htop approach): steady state
+            // is two pread syscalls with no path lookup or open/close.
+            if !st.files.contains_key(&pid) {
+                st.path_buf.clear();
+                let _ = write!(st.path_buf, "/proc/{}/stat", pid);
+                let stat = std::fs::File::open(&st.path_buf);
+                st.path_buf.clear();
+                let _ = write!(st.path_buf, "/proc/{}/statm", pid);
+                let statm = std::fs::File::open(&st.path_buf);
+                if let (Ok(stat), Ok(statm)) = (stat, statm) {
+                    st.files.insert(pid, (stat, statm));
+                }
+            }
+
+            let mut dead = false;
+            if let Some((stat_file, statm_file)) = st.files.get(&pid) {
+                if procfs::pread_into(statm_file, &mut st.statm_buf) {
+                    if let Some(rss) = procfs::parse_statm_rss(&st.statm_buf) {
+                        point.memory_rss = rss;
+                    }
+                } else {
+                    dead = true;
+                }
+
+                if procfs::pread_into(stat_file, &mut st.stat_buf) {
+                    if let Some(jiffies) = procfs::parse_stat_jiffies(&st.stat_buf) {
+                        let now = Instant::now();
+                        if let Some((prev_jiffies, prev_instant)) = st.prev_jiffies.get(&pid) {
+                            let dt = now.duration_since(*prev_instant).as_secs_f64();
+                            if dt > 0.0 {
+                                // Per-core summed CPU% (can exceed 100%), matching top/sysinfo on Linux.
+                                let pct = (jiffies.saturating_sub(*prev_jiffies) as f64
+                                    / procfs::clk_tck())
+                                    / dt
+                                    * 100.0;
+                                point.cpu_os_usage = os_cpu_pct_for_task_manager(pct as f32);
+                                point.cpu_usage = point.cpu_os_usage;
+                            }
+                        }
+                        st.prev_jiffies.insert(pid, (jiffies, now));
+                    }
+                } else {
+                    dead = true;
+                }
+            }
+            // Reads fail once the process is gone (or the pid is reused);
+            // drop the handles so the next tick re-opens fresh ones.
+            if dead {
+                st.files.remove(&pid);
+                st.prev_jiffies.remove(&pid);
+            }
+        }
+
+        #[cfg(not(target_os = "linux"))]
         if pid < 90000 {
             let sys_pid = Pid::from(pid as usize);
             if let Some(process) = self.system.process(sys_pid) {
@@ -1,6 +1,7 @@
 
 use tauri::{AppHandle, Emitter, State, Manager};
-use std::sync::{Arc, Mutex};
+use std::sync::{Arc, Condvar, Mutex};
+use std::sync::atomic::{AtomicBool, Ordering};
 use std::collections::HashMap;
 use tauri_plugin_shell::ShellExt;
 use tauri_plugin_shell::process::{CommandEvent, CommandChild};
@@ -21,7 +22,7 @@ use chrono::{DateTime, Utc, TimeZone};
 use serde_json::json;
 use serde_json::Value;
 #[cfg(target_os = "macos")]
-use std::time::Duration;
+use std::time::{Duration, Instant};
 use base64::Engine;
 use tauri::path::BaseDirectory;
 use serde::{Deserialize, Serialize};
@@ -34,7 +35,10 @@ use std::io::Write;
 pub struct CollectionState {
     // Child process handle to write to stdin or kill
     pub child: Arc<Mutex<Option<CommandChild>>>,
-    pub is_running: Arc<Mutex<bool>>,
+    // Atomic so the per-tick liveness check doesn't take a lock; the paired
+    // condvar wakes the collection loop's sleep immediately on stop.
+    pub is_running: Arc<AtomicBool>,
+    pub stop_signal: Arc<(Mutex<()>, Condvar)>,
     pub buffer: Arc<Mutex<Vec<BatchMetric>>>,
     pub target_pids: Arc<Mutex<Vec<u32>>>,
     pub mode: Arc<Mutex<String>>,
@@ -54,7 +58,8 @@ impl CollectionState {
     pub fn new() -> Self {
         Self {
             child: Arc::new(Mutex::new(None)),
-            is_running: Arc::new(Mutex::new(false)),
+            is_running: Arc::new(AtomicBool::new(false)),
+            stop_signal: Arc::new((Mutex::new(()), Condvar::new())),
             buffer: Arc::new(Mutex::new(Vec::new())),
             target_pids: Arc::new(Mutex::new(Vec::new())),
             mode: Arc::new(Mutex::new("system".to_string())),
@@ -87,7 +92,7 @@ pub struct CollectionStatus {
 #[tauri::command]
 pub fn get_collection_status(state: State<'_, CollectionState>) -> Result<CollectionStatus, String> {
     Ok(CollectionStatus {
-        is_running: *safe_lock(&state.is_running),
+        is_running: state.is_running.load(Ordering::Acquire),
         target_pids: safe_lock(&state.target_pids).clone(),
         mode: safe_lock(&state.mode).clone(),
         interval_ms: *safe_lock(&state.interval_ms),
@@ -767,7 +772,7 @@ pub fn push_custom_metric(
     let _ = app.emit("new-metric-batch", &batch);
     
     // Only save if running
-    if *safe_lock(&state.is_running) {
+    if state.is_running.load(Ordering::Acquire) {
         safe_lock(&state.buffer).push(batch);
     }
 }
@@ -797,19 +802,44 @@ pub fn process_metric_payload(
             total_mem_raw as f64
         };
         
-        let mut metrics = HashMap::new();
-        if let Some(obj) = data["metrics"].as_object() {
+        // Normalize the two supported layouts into (pid, cpu, memory) rows:
+        // - SoA arrays {"pids":[..],"cpu":[..],"memory":[..]} from the sidecar
+        // - per-pid object {"metrics":{pid:{cpu,memory}}} from the websocket
+        let mut entries: Vec<(u32, f64, f64)> = Vec::new();
+        if let (Some(pids), Some(cpus), Some(mems)) = (
+            data["pids"].as_array(),
+            data["cpu"].as_array(),
+            data["memory"].as_array(),
+        ) {
+            for i in 0..pids.len() {
+                entries.push((
+                    pids[i].as_u64().unwrap_or(0) as u32,
+                    cpus.get(i).and_then(|v| v.as_f64()).unwrap_or(0.0),
+                    mems.get(i).and_then(|v| v.as_f64()).unwrap_or(0.0),
+                ));
+            }
+        } else if let Some(obj) = data["metrics"].as_object() {
             for (pid_str, val) in obj {
                 if !val.is_null() {
-                    let pid = pid_str.parse::<u32>().unwrap_or(0);
-                    
+                    entries.push((
+                        pid_str.parse::<u32>().unwrap_or(0),
+                        val["cpu"].as_f64().unwrap_or(0.0),
+                        val["memory"].as_f64().unwrap_or(0.0),
+                    ));
+                }
+            }
+        }
+
+        let mut metrics = HashMap::new();
+        {
+            for (pid, cpu_raw, mem_raw) in entries {
+                {
                     // Strict filtering: Only record requested PIDs
                     if !target_pids.contains(&pid) {
                         continue;
                     }
 
-                    let cpu = val["cpu"].as_f64().unwrap_or(0.0) as f32;
-                    let mem_raw = val["memory"].as_f64().unwrap_or(0.0);
+                    let cpu = cpu_raw as f32;
 
                     // Websocket payloads (from perf-sight-extension) should send memory in MB.
                     // Guard against occasional unit flips (bytes vs MB) and glitch spikes.
@@ -905,28 +935,27 @@ pub fn process_metric_payload(
         }
         
         if !metrics.is_empty() {
-            let is_running = *safe_lock(&state.is_running);
             let batch = BatchMetric { timestamp, metrics };
 
-            if is_running {
+            // One serialization per tick: emit the batch as-is, then move it
+            // into the recording buffer without cloning. The frontend merges
+            // same-timestamp partial batches itself, so re-emitting the merged
+            // union (which re-sent already-delivered pids) is unnecessary.
+            let _ = app.emit("new-metric-batch", &batch);
+
+            if state.is_running.load(Ordering::Acquire) {
                 // Merge logic for recording
                 let mut buffer = safe_lock(&state.buffer);
                 if let Some(last) = buffer.last_mut() {
                     if last.timestamp == timestamp {
-                        for (pid, mp) in batch.metrics.clone() {
+                        for (pid, mp) in batch.metrics {
                             last.metrics.insert(pid, mp);
                         }
-                        let merged = last.clone();
-                        drop(buffer);
-                        let _ = app.emit("new-metric-batch", &merged);
                         return;
                     }
                 }
-                buffer.push(batch.clone());
+                buffer.push(batch);
             }
-            
-            // Emit for live preview (if not merged above)
-            let _ = app.emit("new-metric-batch", &batch);
         }
     }
 }
@@ -1058,7 +1087,7 @@ pub async fn start_collection(
     .unwrap_or_default();
     *safe_lock(&state.process_snapshot) = snapshot;
 
-    *safe_lock(&state.is_running) = true;
+    state.is_running.store(true, Ordering::Release);
     safe_lock(&state.buffer).clear();
 
     // macOS System API: use native Rust collector for accurate CPU + RSS ("Real Memory Size").
@@ -1073,7 +1102,9 @@ pub async fn start_collection(
 
         tauri::async_runtime::spawn_blocking(move || {
             let mut collector = create_collector(&mode);
-            while *safe_lock(&state_clone.is_running) {
+            let interval = Duration::from_millis(interval_ms);
+            let mut next_tick = Instant::now() + interval;
+            while state_clone.is_running.load(Ordering::Relaxed) {
                 collector.update();
 
                 let mut metrics = HashMap::new();
@@ -1089,7 +1120,20 @@ pub async fn start_collection(
                     safe_lock(&state_clone.buffer).push(batch);
                 }
 
-                std::thread::sleep(Duration::from_millis(interval_ms));
+                // Fixed-rate cadence: wait until the absolute deadline so the
+                // collector's work time doesn't accumulate as drift, and skip
+                // missed ticks rather than firing back-to-back catch-ups.
+                // stop_collection signals the condvar so shutdown doesn't wait
+                // out the remainder of the interval.
+                if let Some(remaining) = next_tick.checked_duration_since(Instant::now()) {
+                    let (lock, cvar) = &*state_clone.stop_signal;
+                    let guard = safe_lock(lock);
+                    let _ = cvar.wait_timeout(guard, remaining);
+                }
+                next_tick += interval;
+                if next_tick < Instant::now() {
+                    next_tick = Instant::now() + interval;
+                }
             }
         });
 
@@ -1167,7 +1211,8 @@ pub async fn stop_collection(
         let _ = child.write(cmd.as_bytes());
     }
     
-    *safe_lock(&state.is_running) = false;
+    state.is_running.store(false, Ordering::Release);
+    state.stop_signal.1.notify_all();
     
     // 2. Save Report
     let mut buffer = safe_lock(&state.buffer);
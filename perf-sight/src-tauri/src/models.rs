@@ -29,16 +29,26 @@ pub struct MetricPoint {
     /// OS-level CPU% for this PID (sysinfo).
     pub cpu_os_usage: f32,
     /// Chrome Task Manager-aligned CPU% derived from CDP cpuTime deltas (when available).
+    ///
+    /// Optional fields are omitted (not serialized as null) when absent: a
+    /// typical system-mode point carries none of them, which roughly halves
+    /// the per-tick IPC payload. Missing keys deserialize back to None.
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub cpu_chrome_usage: Option<f32>,
     pub memory_rss: u64,
     /// OS task-manager style memory footprint (macOS: phys_footprint), when available.
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub memory_footprint: Option<u64>,
-    pub gpu_usage: Option<f32>, 
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub gpu_usage: Option<f32>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub js_heap_size: Option<u64>, // Browser Metric
     // Browser Task Manager-aligned metric (when available via CDP SystemInfo.getProcessInfo)
     // Typically reported as "Memory footprint" / private memory.
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub memory_private: Option<u64>,
     // Dynamic metrics extracted from Console Logs or Custom Events (e.g. "Inference Time", "FPS")
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub custom_metrics: Option<HashMap<String, f64>>,
 }
 
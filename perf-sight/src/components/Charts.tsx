@@ -24,6 +24,10 @@ export interface ProcessInfo {
   proc_type: string;
   title?: string;
   url?: string;
+  // Precomputed lowercase search fields, filled in when the list is loaded
+  // so the filter avoids per-keystroke toLowerCase allocations.
+  _nameLower?: string;
+  _titleLower?: string;
 }
 
 interface ChartsProps {
@@ -35,12 +39,58 @@ interface ChartsProps {
   metricStandard: "os" | "chrome";
 }
 
+// Theme-dependent recharts props, precomputed once per theme. Passing the
+// same object identities every render lets recharts' pure children take the
+// fast === path instead of re-diffing freshly allocated style literals.
+const CHART_THEMES = {
+  dark: {
+    gridStroke: "#1e293b", // slate-800
+    axisStroke: "#475569", // slate-600
+    tick: { fill: "#94a3b8" }, // slate-400
+    tooltipStyle: {
+      backgroundColor: "#0f172a",
+      borderColor: "#334155",
+      color: "#f1f5f9",
+    },
+    legendWrapperStyle: { cursor: "pointer", color: "#cbd5e1" },
+    brushFill: "#1e293b",
+  },
+  light: {
+    gridStroke: "#e2e8f0", // slate-200
+    axisStroke: "#94a3b8", // slate-400
+    tick: { fill: "#64748b" }, // slate-500
+    tooltipStyle: {
+      backgroundColor: "#ffffff",
+      borderColor: "#e2e8f0",
+      color: "#0f172a",
+    },
+    legendWrapperStyle: { cursor: "pointer", color: "#334155" },
+    brushFill: "#e2e8f0",
+  },
+} as const;
+
+// CPU domain is rounded up to 50% buckets: stable across ticks, but still
+// grows past 100 for per-core-summed values (multi-threaded processes on
+// macOS/Linux report Activity-Monitor-style CPU that routinely exceeds 100%).
+const CPU_DOMAIN_BUCKET = 50;
+// Memory domain is rounded up to 50 MB buckets so ticks don't jitter on
+// every sample while still tracking real growth.
+const MEM_DOMAIN_BUCKET = 50 * 1024 * 1024;
+
+const BYTE_UNITS = ["B", "KB", "MB", "GB"];
+const BYTE_SCALES = [1, 1024, 1024 ** 2, 1024 ** 3];
+
 const formatBytes = (bytes: number) => {
-  if (bytes === 0) return "0 B";
-  const k = 1024;
-  const sizes = ["B", "KB", "MB", "GB"];
-  const i = Math.floor(Math.log(bytes) / Math.log(k));
-  return parseFloat((bytes / Math.pow(k, i)).toFixed(1)) + " " + sizes[i];
+  if (bytes < 1) return "0 B";
+  // Unit selection via clz32 instead of Math.log/Math.pow: the top bit
+  // position divided by 10 is the 1024-power. clz32 only sees 32 bits, so
+  // values past 2^32 (RSS on 64-bit builds can exceed 4 GB) use the high word.
+  const bit =
+    bytes < 4294967296
+      ? 31 - Math.clz32(bytes)
+      : 63 - Math.clz32(bytes / 4294967296);
+  const i = Math.min(BYTE_UNITS.length - 1, (bit / 10) | 0);
+  return parseFloat((bytes / BYTE_SCALES[i]).toFixed(1)) + " " + BYTE_UNITS[i];
 };
 
 const getColor = (index: number) => {
@@ -63,6 +113,18 @@ const displayProcessLabel = (p: ProcessInfo) => {
   return `${base} (${p.pid})`;
 };
 
+// SoA column extraction: the analysis loops below (series totals, MAD
+// outliers, domain max) read contiguous Float64Arrays instead of chasing a
+// dynamic object key per point. Missing samples become NaN.
+const extractColumn = (data: any[], key: string) => {
+  const col = new Float64Array(data.length);
+  for (let i = 0; i < data.length; i++) {
+    const v = data[i]?.[key];
+    col[i] = typeof v === "number" ? v : NaN;
+  }
+  return col;
+};
+
 const median = (arr: number[]) => {
   if (arr.length === 0) return 0;
   const s = [...arr].sort((a, b) => a - b);
@@ -70,16 +132,13 @@ const median = (arr: number[]) => {
   return s.length % 2 === 0 ? (s[mid - 1] + s[mid]) / 2 : s[mid];
 };
 
-const madOutlierIndexes = (
-  values: Array<number | undefined | null>,
-  z = 3.5
-) => {
+const madOutlierIndexes = (values: ArrayLike<number>, z = 3.5) => {
   // Robust outlier detection using Median Absolute Deviation (MAD).
   // Returns a set of sample indexes considered anomalous.
   const finite: number[] = [];
-  values.forEach((v) => {
-    if (typeof v === "number" && Number.isFinite(v)) finite.push(v);
-  });
+  for (let i = 0; i < values.length; i++) {
+    if (Number.isFinite(values[i])) finite.push(values[i]);
+  }
   if (finite.length < 8) return new Set<number>();
   const m = median(finite);
   const absDevs = finite.map((v) => Math.abs(v - m));
@@ -87,23 +146,21 @@ const madOutlierIndexes = (
   if (!Number.isFinite(mad) || mad === 0) return new Set<number>();
   const denom = 1.4826 * mad;
   const out = new Set<number>();
-  values.forEach((v, idx) => {
-    if (typeof v !== "number" || !Number.isFinite(v)) return;
+  for (let idx = 0; idx < values.length; idx++) {
+    const v = values[idx];
+    if (!Number.isFinite(v)) continue;
     const rz = Math.abs((v - m) / denom);
     if (rz >= z) out.add(idx);
-  });
+  }
   return out;
 };
 
-const madOutlierIndexesUpper = (
-  values: Array<number | undefined | null>,
-  z = 3.5
-) => {
+const madOutlierIndexesUpper = (values: ArrayLike<number>, z = 3.5) => {
   // Same as MAD outlier detection, but only flags unusually HIGH values (spikes).
   const finite: number[] = [];
-  values.forEach((v) => {
-    if (typeof v === "number" && Number.isFinite(v)) finite.push(v);
-  });
+  for (let i = 0; i < values.length; i++) {
+    if (Number.isFinite(values[i])) finite.push(values[i]);
+  }
   if (finite.length < 8) return new Set<number>();
   const m = median(finite);
   const absDevs = finite.map((v) => Math.abs(v - m));
@@ -111,12 +168,13 @@ const madOutlierIndexesUpper = (
   if (!Number.isFinite(mad) || mad === 0) return new Set<number>();
   const denom = 1.4826 * mad;
   const out = new Set<number>();
-  values.forEach((v, idx) => {
-    if (typeof v !== "number" || !Number.isFinite(v)) return;
-    if (v <= m) return; // only upper-tail spikes
+  for (let idx = 0; idx < values.length; idx++) {
+    const v = values[idx];
+    if (!Number.isFinite(v)) continue;
+    if (v <= m) continue; // only upper-tail spikes
     const rz = Math.abs((v - m) / denom);
     if (rz >= z) out.add(idx);
-  });
+  }
   return out;
 };
 
@@ -144,7 +202,7 @@ const buildRangesFromMask = (
   return ranges;
 };
 
-const rollingMean = (arr: number[], win: number) => {
+const rollingMean = (arr: ArrayLike<number>, win: number) => {
   if (arr.length === 0) return [];
   const w = Math.max(3, win | 0);
   const out = new Array(arr.length).fill(0);
@@ -169,19 +227,22 @@ const stddev = (arr: number[]) => {
   return Math.sqrt(v);
 };
 
-export const PerformanceCharts: React.FC<ChartsProps> = ({
+// Memoized: Dashboard re-renders on every keystroke in the filter box and
+// on unrelated form state; with stable props (ring-buffer data identity,
+// useCallback handlers) the whole SVG subtree is skipped in those renders.
+export const PerformanceCharts: React.FC<ChartsProps> = React.memo(function PerformanceCharts({
   data,
   selectedProcesses,
   hiddenPids,
   onToggleVisibility,
   mode,
   metricStandard,
-}) => {
+}) {
   const { theme } = useTheme();
   const isDark = theme === "dark";
-  const gridStroke = isDark ? "#1e293b" : "#e2e8f0"; // slate-800 / slate-200
-  const axisStroke = isDark ? "#475569" : "#94a3b8"; // slate-600 / slate-400
-  const tickFill = isDark ? "#94a3b8" : "#64748b"; // slate-400 / slate-500
+  const chartTheme = CHART_THEMES[isDark ? "dark" : "light"];
+  const gridStroke = chartTheme.gridStroke;
+  const axisStroke = chartTheme.axisStroke;
 
   const [viewMode, setViewMode] = useState<"combined" | "split">("combined");
   const [showAnomalyDots, setShowAnomalyDots] = useState(true);
@@ -205,14 +266,36 @@ export const PerformanceCharts: React.FC<ChartsProps> = ({
     return undefined;
   };
 
+  const preferChromeCpu = mode === "browser" && metricStandard === "chrome";
+  const preferChromeMem = mode === "browser" && metricStandard === "chrome";
+
+  // One contiguous Float64Array column per candidate series key of the
+  // current selection; every analysis pass below reads these instead of
+  // per-point object fields.
+  const columns = useMemo(() => {
+    const map = new Map<string, Float64Array>();
+    if (!data?.length) return map;
+    const prefixes = preferChromeCpu
+      ? ["cpuch", "cpuos", "cpu", "pmem", "foot", "rss"]
+      : ["cpuos", "cpu", "foot", "rss"];
+    selectedProcesses.forEach((p) => {
+      for (const pfx of prefixes) {
+        const key = `${pfx}_${p.pid}`;
+        if (!map.has(key)) map.set(key, extractColumn(data, key));
+      }
+    });
+    return map;
+  }, [data, selectedProcesses, preferChromeCpu]);
+
+  const getColumn = (key: string) => columns.get(key) ?? extractColumn(data, key);
+
   // Prefer stability over "latest-only" key selection: pick the metric key prefix
   // that exists for the largest number of samples for this PID.
   const countDefined = (pid: number, prefix: string): number => {
-    const key = `${prefix}_${pid}`;
+    const col = getColumn(`${prefix}_${pid}`);
     let n = 0;
-    for (let i = 0; i < data.length; i++) {
-      const v = data[i]?.[key];
-      if (typeof v === "number" && Number.isFinite(v)) n++;
+    for (let i = 0; i < col.length; i++) {
+      if (Number.isFinite(col[i])) n++;
     }
     return n;
   };
@@ -233,8 +316,6 @@ export const PerformanceCharts: React.FC<ChartsProps> = ({
   const latestTimestamp = data.length
     ? data[data.length - 1]?.timestamp
     : undefined;
-  const preferChromeCpu = mode === "browser" && metricStandard === "chrome";
-  const preferChromeMem = mode === "browser" && metricStandard === "chrome";
 
   // Identify PIDs that are "Log Only" (have custom metrics but 0 or missing CPU/Memory).
   // We don't want to clutter the main CPU/Memory charts with flat lines for these.
@@ -297,18 +378,18 @@ export const PerformanceCharts: React.FC<ChartsProps> = ({
       };
     }
 
-    const totals: number[] = data.map((d) => {
-      let sum = 0;
-      cpuKeys.forEach((k) => {
-        const v = d?.[k];
-        if (typeof v === "number" && Number.isFinite(v)) sum += v;
-      });
-      return sum;
+    const totals = new Float64Array(data.length);
+    cpuKeys.forEach((k) => {
+      const col = getColumn(k);
+      for (let i = 0; i < col.length; i++) {
+        const v = col[i];
+        if (Number.isFinite(v)) totals[i] += v;
+      }
     });
 
     // High CPU threshold:
     // - Use a conservative default (60%) and also adapt to workload via p95, whichever is higher.
-    const finiteTotals = totals.filter((v) => Number.isFinite(v));
+    const finiteTotals = Array.from(totals).filter((v) => Number.isFinite(v));
     const p95 = finiteTotals.length
       ? median(
           [...finiteTotals]
@@ -317,7 +398,7 @@ export const PerformanceCharts: React.FC<ChartsProps> = ({
         )
       : 0;
     const threshold = Math.max(60, Number.isFinite(p95) ? p95 : 0);
-    const highMask = totals.map((v) => Number.isFinite(v) && v >= threshold);
+    const highMask = Array.from(totals, (v) => Number.isFinite(v) && v >= threshold);
     const highRanges = buildRangesFromMask(data, highMask, 3);
 
     // Change points: large shift in rolling mean.
@@ -361,17 +442,17 @@ export const PerformanceCharts: React.FC<ChartsProps> = ({
       };
     }
 
-    const totalsBytes: number[] = data.map((d) => {
-      let sum = 0;
-      memKeys.forEach((k) => {
-        const v = d?.[k];
-        if (typeof v === "number" && Number.isFinite(v)) sum += v;
-      });
-      return sum;
+    const totalsBytes = new Float64Array(data.length);
+    memKeys.forEach((k) => {
+      const col = getColumn(k);
+      for (let i = 0; i < col.length; i++) {
+        const v = col[i];
+        if (Number.isFinite(v)) totalsBytes[i] += v;
+      }
     });
 
     // Threshold: max(1GB, p95 total)
-    const finite = totalsBytes.filter((v) => Number.isFinite(v));
+    const finite = Array.from(totalsBytes).filter((v) => Number.isFinite(v));
     const sorted = [...finite].sort((a, b) => a - b);
     const idx = Math.round((sorted.length - 1) * 0.95);
     const p95 = sorted.length
@@ -381,7 +462,8 @@ export const PerformanceCharts: React.FC<ChartsProps> = ({
       1024 * 1024 * 1024,
       Number.isFinite(p95) ? p95 : 0
     );
-    const highMask = totalsBytes.map(
+    const highMask = Array.from(
+      totalsBytes,
       (v) => Number.isFinite(v) && v >= threshold
     );
     const highRanges = buildRangesFromMask(data, highMask, 3);
@@ -402,6 +484,58 @@ export const PerformanceCharts: React.FC<ChartsProps> = ({
     return { highRanges, changeLines };
   }, [data, selectedProcesses, hiddenPids, preferChromeMem]);
 
+  // Bucketed upper bound for the memory Y axis. The axis domain only
+  // changes when usage crosses a 50 MB boundary, so recharts skips tick
+  // regeneration on the vast majority of appends.
+  const memDomainMax = useMemo(() => {
+    let max = 0;
+    selectedProcesses.forEach((p) => {
+      if (hiddenPids.has(p.pid)) return;
+      const prefix = chooseBestPrefix(
+        p.pid,
+        preferChromeMem ? ["pmem", "foot", "rss"] : ["foot", "rss"]
+      );
+      const col = getColumn(`${prefix}_${p.pid}`);
+      for (let i = 0; i < col.length; i++) {
+        const v = col[i];
+        if (Number.isFinite(v) && v > max) max = v;
+      }
+    });
+    return Math.max(
+      MEM_DOMAIN_BUCKET,
+      Math.ceil(max / MEM_DOMAIN_BUCKET) * MEM_DOMAIN_BUCKET
+    );
+  }, [data, selectedProcesses, hiddenPids, preferChromeMem]);
+
+  const memDomain = useMemo<[number, number]>(
+    () => [0, memDomainMax],
+    [memDomainMax]
+  );
+
+  // Same bucketing for the CPU Y axis, with a 100% floor: a fixed 0-100
+  // domain would clip per-core-summed CPU from busy multi-threaded processes.
+  const cpuDomainMax = useMemo(() => {
+    let max = 0;
+    selectedProcesses.forEach((p) => {
+      if (hiddenPids.has(p.pid)) return;
+      const prefix = chooseBestPrefix(
+        p.pid,
+        preferChromeCpu ? ["cpuch", "cpuos", "cpu"] : ["cpuos", "cpu"]
+      );
+      const col = getColumn(`${prefix}_${p.pid}`);
+      for (let i = 0; i < col.length; i++) {
+        const v = col[i];
+        if (Number.isFinite(v) && v > max) max = v;
+      }
+    });
+    return Math.max(100, Math.ceil(max / CPU_DOMAIN_BUCKET) * CPU_DOMAIN_BUCKET);
+  }, [data, selectedProcesses, hiddenPids, preferChromeCpu]);
+
+  const cpuDomain = useMemo<[number, number]>(
+    () => [0, cpuDomainMax],
+    [cpuDomainMax]
+  );
+
   // Pre-compute anomaly indexes for each visible series (CPU + Memory).
   const anomalyIndexBySeriesKey = useMemo(() => {
     const map = new Map<string, Set<number>>();
@@ -415,10 +549,7 @@ export const PerformanceCharts: React.FC<ChartsProps> = ({
         preferChromeCpu ? ["cpuch", "cpuos", "cpu"] : ["cpuos", "cpu"]
       );
       const cpuKey = `${cpuPrefix}_${p.pid}`;
-      map.set(
-        cpuKey,
-        madOutlierIndexes(data.map((d) => d?.[cpuKey] as number | undefined))
-      );
+      map.set(cpuKey, madOutlierIndexes(getColumn(cpuKey)));
 
       // Memory keys
       const memPrefix = chooseBestPrefix(
@@ -426,13 +557,8 @@ export const PerformanceCharts: React.FC<ChartsProps> = ({
         preferChromeMem ? ["pmem", "foot", "rss"] : ["foot", "rss"]
       );
       const memKey = `${memPrefix}_${p.pid}`;
-      map.set(
-        memKey,
-        // For memory we only mark upward spikes (not downward dips).
-        madOutlierIndexesUpper(
-          data.map((d) => d?.[memKey] as number | undefined)
-        )
-      );
+      // For memory we only mark upward spikes (not downward dips).
+      map.set(memKey, madOutlierIndexesUpper(getColumn(memKey)));
     });
 
     return map;
@@ -560,6 +686,52 @@ export const PerformanceCharts: React.FC<ChartsProps> = ({
     );
   };
 
+  // Live-card values are formatted once per data change, not on every
+  // render of the charts subtree (view toggles, checkbox state, hover),
+  // and NaN samples fall through to the em-dash instead of "NaN%".
+  const liveCards = useMemo(() => {
+    return selectedProcesses
+      .filter((p) => !logOnlyPids.has(p.pid))
+      .map((p, idx) => {
+        const cpuChrome = getLatestMetric(p.pid, "cpuch");
+        // Backward compatibility: some report payloads only have legacy `cpu_${pid}`.
+        const cpuOs =
+          getLatestMetric(p.pid, "cpuos") ?? getLatestMetric(p.pid, "cpu");
+        const cpu =
+          preferChromeCpu && cpuChrome !== undefined
+            ? cpuChrome
+            : cpuOs ?? cpuChrome;
+
+        const memChrome = getLatestMetric(p.pid, "pmem");
+        const memRss = getLatestMetric(p.pid, "rss");
+        const mem =
+          preferChromeMem && memChrome !== undefined
+            ? memChrome
+            : memRss ?? memChrome;
+
+        const heap =
+          mode === "browser" ? getLatestMetric(p.pid, "heap") : undefined;
+        const pmem = mode === "browser" ? memChrome : undefined;
+
+        return {
+          p,
+          idx,
+          cpuStr:
+            typeof cpu === "number" && Number.isFinite(cpu)
+              ? `${cpu.toFixed(1)}%`
+              : "—",
+          memStr:
+            typeof mem === "number" && Number.isFinite(mem)
+              ? formatBytes(mem)
+              : "—",
+          heapStr: typeof heap === "number" ? formatBytes(heap) : "—",
+          pmemStr: typeof pmem === "number" ? formatBytes(pmem) : "—",
+          rssStr: typeof memRss === "number" ? formatBytes(memRss) : null,
+        };
+      });
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [data, selectedProcesses, logOnlyPids, preferChromeCpu, preferChromeMem, mode]);
+
   const cpuLabel =
     mode === "browser" && metricStandard === "chrome"
       ? "Chrome Task Manager"
@@ -586,32 +758,7 @@ export const PerformanceCharts: React.FC<ChartsProps> = ({
           </div>
 
           <div className="grid grid-cols-1 md:grid-cols-2 xl:grid-cols-3 gap-3">
-            {selectedProcesses
-                .filter(p => !logOnlyPids.has(p.pid))
-                .map((p, idx) => {
-              const cpuChrome = getLatestMetric(p.pid, "cpuch");
-              // Backward compatibility: some report payloads only have legacy `cpu_${pid}`.
-              const cpuOs =
-                getLatestMetric(p.pid, "cpuos") ??
-                getLatestMetric(p.pid, "cpu");
-              const cpu =
-                preferChromeCpu && cpuChrome !== undefined
-                  ? cpuChrome
-                  : cpuOs ?? cpuChrome;
-
-              const memChrome = getLatestMetric(p.pid, "pmem");
-              const memRss = getLatestMetric(p.pid, "rss");
-              const mem =
-                preferChromeMem && memChrome !== undefined
-                  ? memChrome
-                  : memRss ?? memChrome;
-
-              const rss = getLatestMetric(p.pid, "rss");
-              const heap =
-                mode === "browser" ? getLatestMetric(p.pid, "heap") : undefined;
-              const pmem =
-                mode === "browser" ? getLatestMetric(p.pid, "pmem") : undefined;
-
+            {liveCards.map(({ p, idx, cpuStr, memStr, heapStr, pmemStr, rssStr }) => {
               return (
                 <div
                   key={`live_${p.pid}`}
@@ -642,7 +789,7 @@ export const PerformanceCharts: React.FC<ChartsProps> = ({
                         CPU ({cpuLabel})
                       </div>
                       <div className="text-lg font-semibold text-slate-900 tabular-nums dark:text-slate-100">
-                        {typeof cpu === "number" ? `${cpu.toFixed(1)}%` : "—"}
+                        {cpuStr}
                       </div>
                     </div>
                     <div>
@@ -655,7 +802,7 @@ export const PerformanceCharts: React.FC<ChartsProps> = ({
                           : "(RSS)"}
                       </div>
                       <div className="text-lg font-semibold text-slate-900 tabular-nums dark:text-slate-100">
-                        {typeof mem === "number" ? formatBytes(mem) : "—"}
+                        {memStr}
                       </div>
                     </div>
                   </div>
@@ -668,7 +815,7 @@ export const PerformanceCharts: React.FC<ChartsProps> = ({
                             JS Heap
                           </div>
                           <div className="text-base font-semibold text-slate-900 tabular-nums dark:text-slate-100">
-                            {typeof heap === "number" ? formatBytes(heap) : "—"}
+                            {heapStr}
                           </div>
                         </div>
                         <div>
@@ -676,19 +823,18 @@ export const PerformanceCharts: React.FC<ChartsProps> = ({
                             Memory (Chrome)
                           </div>
                           <div className="text-base font-semibold text-slate-900 tabular-nums dark:text-slate-100">
-                            {typeof pmem === "number" ? formatBytes(pmem) : "—"}
+                            {pmemStr}
                           </div>
                         </div>
                       </div>
-                      {metricStandard === "chrome" &&
-                        typeof rss === "number" && (
-                          <div className="mt-2 text-xs text-slate-500">
-                            OS RSS (reference):{" "}
-                            <span className="tabular-nums text-slate-600 dark:text-slate-300">
-                              {formatBytes(rss)}
-                            </span>
-                          </div>
-                        )}
+                      {metricStandard === "chrome" && rssStr !== null && (
+                        <div className="mt-2 text-xs text-slate-500">
+                          OS RSS (reference):{" "}
+                          <span className="tabular-nums text-slate-600 dark:text-slate-300">
+                            {rssStr}
+                          </span>
+                        </div>
+                      )}
                     </div>
                   )}
                 </div>
@@ -761,10 +907,16 @@ export const PerformanceCharts: React.FC<ChartsProps> = ({
                   tickFormatter={(time) => new Date(time).toLocaleTimeString()}
                   minTickGap={50}
                   stroke={axisStroke}
-                  tick={{ fill: tickFill }}
+                  tick={chartTheme.tick}
                   fontSize={10}
                 />
-                <YAxis stroke={axisStroke} tick={{ fill: tickFill }} fontSize={12} />
+                <YAxis
+                  stroke={axisStroke}
+                  tick={chartTheme.tick}
+                  fontSize={12}
+                  domain={cpuDomain}
+                  allowDataOverflow
+                />
                 <Tooltip content={<CpuTooltip />} />
                 <Legend
                   onClick={(e) => {
@@ -777,10 +929,7 @@ export const PerformanceCharts: React.FC<ChartsProps> = ({
                       }
                     }
                   }}
-                  wrapperStyle={{
-                    cursor: "pointer",
-                    color: isDark ? "#cbd5e1" : "#334155",
-                  }}
+                  wrapperStyle={chartTheme.legendWrapperStyle}
                 />
                 {/* CPU annotations (combined): sustained-high ranges + change points */}
                 {showAnnotations &&
@@ -837,7 +986,7 @@ export const PerformanceCharts: React.FC<ChartsProps> = ({
                   dataKey="timestamp"
                   height={30}
                   stroke="#4f46e5"
-                  fill={isDark ? "#1e293b" : "#e2e8f0"}
+                  fill={chartTheme.brushFill}
                   tickFormatter={() => ""}
                 />
               </LineChart>
@@ -864,9 +1013,11 @@ export const PerformanceCharts: React.FC<ChartsProps> = ({
                       <XAxis dataKey="timestamp" hide />
                       <YAxis
                         stroke={axisStroke}
-                        tick={{ fill: tickFill }}
+                        tick={chartTheme.tick}
                         fontSize={10}
                         width={30}
+                        domain={cpuDomain}
+                        allowDataOverflow
                       />
                       <Tooltip
                         content={<CpuTooltip />}
@@ -929,13 +1080,15 @@ export const PerformanceCharts: React.FC<ChartsProps> = ({
                   tickFormatter={(time) => new Date(time).toLocaleTimeString()}
                   minTickGap={50}
                   stroke={axisStroke}
-                  tick={{ fill: tickFill }}
+                  tick={chartTheme.tick}
                   fontSize={10}
                 />
                 <YAxis
                   stroke={axisStroke}
-                  tick={{ fill: tickFill }}
+                  tick={chartTheme.tick}
                   fontSize={12}
+                  domain={memDomain}
+                  allowDataOverflow
                   tickFormatter={(val) => (val / 1024 / 1024).toFixed(0)}
                 />
                 <Tooltip content={<MemTooltip />} />
@@ -950,10 +1103,7 @@ export const PerformanceCharts: React.FC<ChartsProps> = ({
                       }
                     }
                   }}
-                  wrapperStyle={{
-                    cursor: "pointer",
-                    color: isDark ? "#cbd5e1" : "#334155",
-                  }}
+                  wrapperStyle={chartTheme.legendWrapperStyle}
                 />
                 {/* Memory annotations (combined): sustained-high ranges + change points */}
                 {showAnnotations &&
@@ -1014,7 +1164,7 @@ export const PerformanceCharts: React.FC<ChartsProps> = ({
                   dataKey="timestamp"
                   height={30}
                   stroke="#34d399"
-                  fill={isDark ? "#1e293b" : "#e2e8f0"}
+                  fill={chartTheme.brushFill}
                   tickFormatter={() => ""}
                 />
               </LineChart>
@@ -1045,9 +1195,11 @@ export const PerformanceCharts: React.FC<ChartsProps> = ({
                       <XAxis dataKey="timestamp" hide />
                       <YAxis
                         stroke={axisStroke}
-                        tick={{ fill: tickFill }}
+                        tick={chartTheme.tick}
                         fontSize={10}
                         width={30}
+                        domain={memDomain}
+                        allowDataOverflow
                         tickFormatter={(val) => (val / 1024 / 1024).toFixed(0)}
                       />
                       <Tooltip
@@ -1111,21 +1263,17 @@ export const PerformanceCharts: React.FC<ChartsProps> = ({
                     }
                     minTickGap={50}
                     stroke={axisStroke}
-                    tick={{ fill: tickFill }}
+                    tick={chartTheme.tick}
                     fontSize={10}
                   />
                   <YAxis
                     stroke={axisStroke}
-                    tick={{ fill: tickFill }}
+                    tick={chartTheme.tick}
                     fontSize={12}
                     tickFormatter={(val) => formatBytes(val)}
                   />
                   <Tooltip
-                    contentStyle={{
-                      backgroundColor: isDark ? "#0f172a" : "#ffffff",
-                      borderColor: isDark ? "#334155" : "#e2e8f0",
-                      color: isDark ? "#f1f5f9" : "#0f172a",
-                    }}
+                    contentStyle={chartTheme.tooltipStyle}
                     labelFormatter={(label) =>
                       new Date(label).toLocaleTimeString()
                     }
@@ -1142,10 +1290,7 @@ export const PerformanceCharts: React.FC<ChartsProps> = ({
                         }
                       }
                     }}
-                    wrapperStyle={{
-                      cursor: "pointer",
-                      color: isDark ? "#cbd5e1" : "#334155",
-                    }}
+                    wrapperStyle={chartTheme.legendWrapperStyle}
                   />
                   {selectedProcesses.map((p, idx) => (
                     <Line
@@ -1164,7 +1309,7 @@ export const PerformanceCharts: React.FC<ChartsProps> = ({
                     dataKey="timestamp"
                     height={30}
                     stroke="#4f46e5"
-                    fill={isDark ? "#1e293b" : "#e2e8f0"}
+                    fill={chartTheme.brushFill}
                     tickFormatter={() => ""}
                   />
                 </LineChart>
@@ -1191,17 +1336,13 @@ export const PerformanceCharts: React.FC<ChartsProps> = ({
                         <XAxis dataKey="timestamp" hide />
                         <YAxis
                           stroke={axisStroke}
-                          tick={{ fill: tickFill }}
+                          tick={chartTheme.tick}
                           fontSize={10}
                           width={40}
                           tickFormatter={(val) => formatBytes(val)}
                         />
                         <Tooltip
-                          contentStyle={{
-                            backgroundColor: isDark ? "#0f172a" : "#ffffff",
-                            borderColor: isDark ? "#334155" : "#e2e8f0",
-                            color: isDark ? "#f1f5f9" : "#0f172a",
-                          }}
+                          contentStyle={chartTheme.tooltipStyle}
                           formatter={(val: number) => [formatBytes(val)]}
                           labelFormatter={() => ""}
                         />
@@ -1267,20 +1408,16 @@ export const PerformanceCharts: React.FC<ChartsProps> = ({
                     tickFormatter={(time) => new Date(time).toLocaleTimeString()}
                     minTickGap={50}
                     stroke={axisStroke}
-                    tick={{ fill: tickFill }}
+                    tick={chartTheme.tick}
                     fontSize={10}
                   />
                   <YAxis
                     stroke={axisStroke}
-                    tick={{ fill: tickFill }}
+                    tick={chartTheme.tick}
                     fontSize={12}
                   />
                   <Tooltip
-                    contentStyle={{
-                      backgroundColor: isDark ? "#0f172a" : "#ffffff",
-                      borderColor: isDark ? "#334155" : "#e2e8f0",
-                      color: isDark ? "#f1f5f9" : "#0f172a",
-                    }}
+                    contentStyle={chartTheme.tooltipStyle}
                     labelFormatter={(label) => new Date(label).toLocaleTimeString()}
                   />
                   <Legend />
@@ -1324,7 +1461,7 @@ export const PerformanceCharts: React.FC<ChartsProps> = ({
                     dataKey="timestamp"
                     height={30}
                     stroke="#8b5cf6"
-                    fill={isDark ? "#1e293b" : "#e2e8f0"}
+                    fill={chartTheme.brushFill}
                     tickFormatter={() => ""}
                   />
                 </LineChart>
@@ -1336,4 +1473,4 @@ export const PerformanceCharts: React.FC<ChartsProps> = ({
       })()}
     </div>
   );
-};
+});
@@ -1,4 +1,6 @@
-import React from 'react';
+import React, { useEffect, useMemo, useRef, useState } from 'react';
+import clsx from 'clsx';
+import { VariableSizeList, ListChildComponentProps } from 'react-window';
 import { Search, RefreshCw, Play, Square, Layers, Globe, Monitor, Box as BoxIcon } from 'lucide-react';
 import { ProcessInfo } from './Charts';
 
@@ -20,14 +22,122 @@ interface ProcessListProps {
   onStop: () => void;
 }
 
-const getProcessIcon = (type: string) => {
-  switch(type) {
-    case 'GPU': return <Layers className="w-4 h-4 text-amber-400" />;
-    case 'Renderer': return <Globe className="w-4 h-4 text-blue-400" />;
-    case 'Browser': return <Monitor className="w-4 h-4 text-slate-400" />;
-    default: return <BoxIcon className="w-4 h-4 text-slate-600" />;
-  }
+// Icons depend only on proc_type and carry no mutable props, so the same
+// element references are safely reused across rows instead of allocating a
+// fresh element per row per render.
+const PROCESS_ICONS: Record<string, JSX.Element> = {
+  GPU: <Layers className="w-4 h-4 text-amber-400" />,
+  Renderer: <Globe className="w-4 h-4 text-blue-400" />,
+  Browser: <Monitor className="w-4 h-4 text-slate-400" />,
 };
+const DEFAULT_PROCESS_ICON = <BoxIcon className="w-4 h-4 text-slate-600" />;
+
+const getProcessIcon = (type: string) =>
+  PROCESS_ICONS[type] ?? DEFAULT_PROCESS_ICON;
+
+// Virtualized row heights (px). Selected rows grow to fit the rename block.
+const ROW_HEIGHT = 64;
+const SELECTED_ROW_HEIGHT = 150;
+
+// Static class prefixes hoisted so only the variant tail is recomputed.
+const ROW_BASE =
+  'w-full text-left px-3 py-2.5 rounded-lg text-sm flex items-start gap-3 transition-colors';
+const CHECKBOX_BASE =
+  'w-4 h-4 rounded border flex items-center justify-center transition-all';
+
+interface ProcessRowProps {
+  p: ProcessInfo;
+  isSelected: boolean;
+  isCollecting: boolean;
+  alias: string;
+  onToggleSelection: (pid: number) => void;
+  onRenameProcess?: (pid: number, alias: string) => void;
+}
+
+// Memoized row: with stable handlers from the parent, a metric tick only
+// re-renders rows whose props actually changed instead of the whole list.
+const ProcessRow = React.memo(function ProcessRow({
+  p, isSelected, isCollecting, alias, onToggleSelection, onRenameProcess
+}: ProcessRowProps) {
+  return (
+    <div
+      className={clsx(
+        ROW_BASE,
+        isSelected
+          ? 'bg-indigo-600/10 border border-indigo-500/30 text-indigo-700 dark:bg-indigo-900/40 dark:border-indigo-500/50 dark:text-indigo-100'
+          : 'hover:bg-slate-100 text-slate-700 border border-transparent dark:hover:bg-slate-800 dark:text-slate-300',
+        isCollecting && 'opacity-50 cursor-not-allowed'
+      )}
+      role="button"
+      tabIndex={0}
+      onClick={() => onToggleSelection(p.pid)}
+      onKeyDown={(e) => {
+        if (e.key === "Enter" || e.key === " ") onToggleSelection(p.pid);
+      }}
+    >
+        <div className={clsx(CHECKBOX_BASE, isSelected ? 'bg-indigo-600 border-indigo-600 dark:bg-indigo-500 dark:border-indigo-500' : 'border-slate-400 dark:border-slate-600')}>
+            {isSelected && <div className="w-2 h-2 bg-white rounded-sm" />}
+        </div>
+        <div className="shrink-0 opacity-80">{getProcessIcon(p.proc_type)}</div>
+        <div className="min-w-0 flex-1">
+        <div className="font-medium truncate">
+            {(alias.trim() ? alias.trim() : (p.title || p.name))}
+        </div>
+        <div className="text-xs opacity-60 truncate flex gap-2 items-center">
+            <span>{p.pid}</span>
+            {p.url && <span className="max-w-[200px] truncate" title={p.url}>• {p.url}</span>}
+            {!p.url && p.proc_type !== 'Browser' && <span>• {p.proc_type}</span>}
+        </div>
+        {isSelected && onRenameProcess ? (
+          <div className="mt-2">
+            <div className="text-[11px] text-slate-500 mb-1 dark:text-slate-500">Rename (optional)</div>
+            <input
+              value={alias}
+              onChange={(e) => onRenameProcess(p.pid, e.target.value)}
+              onClick={(e) => e.stopPropagation()}
+              onKeyDown={(e) => e.stopPropagation()}
+              disabled={isCollecting}
+              placeholder="e.g. Main Tab / Game Client / GPU"
+              className="w-full bg-white border border-slate-200 rounded-lg px-3 py-2 text-xs text-slate-900 placeholder:text-slate-400 disabled:opacity-60 dark:bg-slate-950 dark:border-slate-800 dark:text-slate-200 dark:placeholder:text-slate-600"
+            />
+          </div>
+        ) : null}
+        </div>
+    </div>
+  );
+});
+
+// Everything the row renderer needs per render, threaded through
+// react-window's itemData so the renderer itself can stay module-level.
+interface RowData {
+  processes: ProcessInfo[];
+  selectedPids: Set<number>;
+  isCollecting: boolean;
+  aliases?: Record<number, string>;
+  onToggleSelection: (pid: number) => void;
+  onRenameProcess?: (pid: number, alias: string) => void;
+}
+
+// react-window treats its children prop as a component type, so the renderer
+// must keep a stable identity across parent renders: an inline closure would
+// remount every visible row on each render (dropping focus from the rename
+// input on every keystroke) and defeat the ProcessRow memo above.
+const Row = React.memo(function Row({ index, style, data }: ListChildComponentProps<RowData>) {
+  const p = data.processes[index];
+  const raw = data.aliases ? data.aliases[p.pid] : undefined;
+  return (
+    <div style={style} className="pb-1">
+      <ProcessRow
+        p={p}
+        isSelected={data.selectedPids.has(p.pid)}
+        isCollecting={data.isCollecting}
+        alias={typeof raw === 'string' ? raw : ''}
+        onToggleSelection={data.onToggleSelection}
+        onRenameProcess={data.onRenameProcess}
+      />
+    </div>
+  );
+});
 
 export const ProcessList: React.FC<ProcessListProps> = ({
   processes, selectedPids, isCollecting, mode, 
@@ -48,12 +158,55 @@ export const ProcessList: React.FC<ProcessListProps> = ({
     return typeof raw === "string" ? raw : "";
   };
 
-  const filteredProcesses = processes.filter(p => 
-    p.name.toLowerCase().includes(filterText.toLowerCase()) || 
-    (p.title && p.title.toLowerCase().includes(filterText.toLowerCase())) ||
-    getAlias(p.pid).toLowerCase().includes(filterText.toLowerCase()) ||
-    p.pid.toString().includes(filterText)
-  );
+  // Memoized so metric-tick renders of the parent skip the O(N) lowercase
+  // scan; recomputed only when the list, filter or aliases actually change.
+  const filteredProcesses = useMemo(() => {
+    const q = filterText.toLowerCase();
+    return processes.filter(p =>
+      (p._nameLower ?? p.name.toLowerCase()).includes(q) ||
+      (p._titleLower ?? p.title?.toLowerCase())?.includes(q) ||
+      getAlias(p.pid).toLowerCase().includes(q) ||
+      p.pid.toString().includes(filterText)
+    );
+  }, [processes, filterText, processAliases]);
+
+  // Virtualization: Chrome can spawn hundreds of helper processes; only the
+  // rows in the viewport get DOM nodes.
+  const listContainerRef = useRef<HTMLDivElement | null>(null);
+  const listRef = useRef<VariableSizeList | null>(null);
+  const [listHeight, setListHeight] = useState(300);
+
+  useEffect(() => {
+    const el = listContainerRef.current;
+    if (!el) return;
+    const ro = new ResizeObserver((entries) => {
+      const h = entries[0]?.contentRect?.height;
+      if (h) setListHeight(h);
+    });
+    ro.observe(el);
+    return () => ro.disconnect();
+  }, []);
+
+  useEffect(() => {
+    // Heights depend on selection and the visible subset; drop cached offsets.
+    listRef.current?.resetAfterIndex(0, false);
+  }, [filteredProcesses, selectedPids]);
+
+  const getRowHeight = (index: number) => {
+    const p = filteredProcesses[index];
+    return p && selectedPids.has(p.pid) && onRenameProcess
+      ? SELECTED_ROW_HEIGHT
+      : ROW_HEIGHT;
+  };
+
+  const itemData = useMemo<RowData>(() => ({
+    processes: filteredProcesses,
+    selectedPids,
+    isCollecting,
+    aliases: processAliases,
+    onToggleSelection,
+    onRenameProcess,
+  }), [filteredProcesses, selectedPids, isCollecting, processAliases, onToggleSelection, onRenameProcess]);
 
   return (
     <div className="bg-white border border-slate-200 rounded-xl p-4 flex flex-col flex-1 min-h-0 shadow-lg h-full dark:bg-slate-900/50 dark:border-slate-800">
@@ -74,55 +227,21 @@ export const ProcessList: React.FC<ProcessListProps> = ({
             onChange={e => onFilterChange(e.target.value)}
         />
 
-        <div className="flex-1 overflow-y-auto space-y-1 pr-1 custom-scrollbar">
-            {filteredProcesses.map(p => {
-            const isSelected = selectedPids.has(p.pid);
-            return (
-            <div
-              key={p.pid}
-              className={`w-full text-left px-3 py-2.5 rounded-lg text-sm flex items-start gap-3 transition-colors ${
-              isSelected
-                  ? 'bg-indigo-600/10 border border-indigo-500/30 text-indigo-700 dark:bg-indigo-900/40 dark:border-indigo-500/50 dark:text-indigo-100' 
-                  : 'hover:bg-slate-100 text-slate-700 border border-transparent dark:hover:bg-slate-800 dark:text-slate-300'
-              } ${isCollecting ? 'opacity-50 cursor-not-allowed' : ''}`}
-              role="button"
-              tabIndex={0}
-              onClick={() => onToggleSelection(p.pid)}
-              onKeyDown={(e) => {
-                if (e.key === "Enter" || e.key === " ") onToggleSelection(p.pid);
-              }}
+        <div ref={listContainerRef} className="flex-1 min-h-0 pr-1">
+            {filteredProcesses.length > 0 ? (
+            <VariableSizeList
+              ref={listRef}
+              height={listHeight}
+              width="100%"
+              itemCount={filteredProcesses.length}
+              itemSize={getRowHeight}
+              itemKey={(index) => filteredProcesses[index].pid}
+              itemData={itemData}
+              className="custom-scrollbar"
             >
-                <div className={`w-4 h-4 rounded border flex items-center justify-center transition-all ${isSelected ? 'bg-indigo-600 border-indigo-600 dark:bg-indigo-500 dark:border-indigo-500' : 'border-slate-400 dark:border-slate-600'}`}>
-                    {isSelected && <div className="w-2 h-2 bg-white rounded-sm" />}
-                </div>
-                <div className="shrink-0 opacity-80">{getProcessIcon(p.proc_type)}</div>
-                <div className="min-w-0 flex-1">
-                <div className="font-medium truncate">
-                    {(getAlias(p.pid).trim() ? getAlias(p.pid).trim() : (p.title || p.name))}
-                </div>
-                <div className="text-xs opacity-60 truncate flex gap-2 items-center">
-                    <span>{p.pid}</span>
-                    {p.url && <span className="max-w-[200px] truncate" title={p.url}>• {p.url}</span>}
-                    {!p.url && p.proc_type !== 'Browser' && <span>• {p.proc_type}</span>}
-                </div>
-                {isSelected && onRenameProcess ? (
-                  <div className="mt-2">
-                    <div className="text-[11px] text-slate-500 mb-1 dark:text-slate-500">Rename (optional)</div>
-                    <input
-                      value={getAlias(p.pid)}
-                      onChange={(e) => onRenameProcess(p.pid, e.target.value)}
-                      onClick={(e) => e.stopPropagation()}
-                      onKeyDown={(e) => e.stopPropagation()}
-                      disabled={isCollecting}
-                      placeholder="e.g. Main Tab / Game Client / GPU"
-                      className="w-full bg-white border border-slate-200 rounded-lg px-3 py-2 text-xs text-slate-900 placeholder:text-slate-400 disabled:opacity-60 dark:bg-slate-950 dark:border-slate-800 dark:text-slate-200 dark:placeholder:text-slate-600"
-                    />
-                  </div>
-                ) : null}
-                </div>
-            </div>
-            )})}
-            {filteredProcesses.length === 0 && (
+              {Row}
+            </VariableSizeList>
+            ) : (
             <div className="text-center text-slate-500 py-4 text-sm">
                 {mode === 'browser' ? "No Chrome Tabs found." : "No processes found."}
             </div>
@@ -1,4 +1,5 @@
-import React, { useState, useEffect, useRef } from 'react';
+import React, { useState, useEffect, useRef, useCallback, useMemo } from 'react';
+import clsx from 'clsx';
 import { invoke } from '@tauri-apps/api/core';
 import { listen } from '@tauri-apps/api/event';
 import { Activity, ChevronDown, Folder, Plus, ExternalLink } from 'lucide-react';
@@ -67,6 +68,13 @@ const parseTags = (text: string) => {
 
 const tagsToText = (tags: string[]) => tags.join(", ");
 
+// Static class prefix for the mode switcher buttons; only the active /
+// disabled variants are recomputed per render.
+const MODE_BTN_BASE = "px-3 py-1.5 rounded-md text-sm font-medium transition-all";
+const MODE_BTN_ACTIVE = "bg-indigo-600 text-white shadow-sm";
+const MODE_BTN_IDLE =
+  "text-slate-600 hover:text-slate-900 dark:text-slate-400 dark:hover:text-slate-200";
+
 const genBuildId = () => {
   // Short, human-friendly id for reports (no PII).
   try {
@@ -129,8 +137,19 @@ export const Dashboard: React.FC = () => {
   }, [logConfigs]);
 
   const maxDataPoints = 3600;
+  // Pre-allocated ring buffer backing chartData: appends write in place
+  // instead of re-copying + slicing the whole history every second.
+  const chartBufRef = useRef<any[]>(new Array(maxDataPoints));
+  const chartHeadRef = useRef(0); // total points ever written
   const mockTimerRef = useRef<any>(null);
   const unlistenRef = useRef<null | (() => void)>(null);
+  // In-flight subscription, so concurrent ensureMetricListener calls (mount
+  // effect + mode effect) can't both pass the unlistenRef check and leak a
+  // second listener that would double every metric batch.
+  const listenPromiseRef = useRef<Promise<void> | null>(null);
+  // Batches awaiting the next animation-frame flush (coalesces event bursts).
+  const pendingBatchesRef = useRef<BatchMetric[]>([]);
+  const rafRef = useRef<number | null>(null);
   const isRehydratingRef = useRef(false);
   const autoStopTimeoutRef = useRef<any>(null);
   const isCollectingRef = useRef(false);
@@ -271,18 +290,37 @@ export const Dashboard: React.FC = () => {
         // ignore
       } finally {
         unlistenRef.current = null;
+        listenPromiseRef.current = null;
+      }
+      if (rafRef.current != null) {
+        cancelAnimationFrame(rafRef.current);
+        rafRef.current = null;
       }
+      pendingBatchesRef.current = [];
     };
   }, []);
 
-  const ensureMetricListener = async () => {
-    if (unlistenRef.current) return;
-    unlistenRef.current = await listen("new-metric-batch", (event: any) => {
-      const batch = event.payload as BatchMetric;
-      addBatchMetric(batch);
-    });
+  const ensureMetricListener = () => {
+    if (!listenPromiseRef.current) {
+      listenPromiseRef.current = listen("new-metric-batch", (event: any) => {
+        const batch = event.payload as BatchMetric;
+        queueBatchMetric(batch);
+      }).then((unlisten) => {
+        unlistenRef.current = unlisten;
+      });
+    }
+    return listenPromiseRef.current;
   };
 
+  // Cache lowercase name/title once per list load instead of re-lowercasing
+  // every row on every filter keystroke.
+  const withSearchCache = (list: ProcessInfo[]): ProcessInfo[] =>
+    list.map((p) => ({
+      ...p,
+      _nameLower: p.name.toLowerCase(),
+      _titleLower: p.title?.toLowerCase(),
+    }));
+
   const loadProcesses = async () => {
     try {
       const list = (await invoke("get_process_list", {
@@ -297,11 +335,11 @@ export const Dashboard: React.FC = () => {
         if (!a.title && b.title) return 1;
         return b.cpu_usage - a.cpu_usage;
       });
-      setProcesses(sorted);
+      setProcesses(withSearchCache(sorted));
     } catch (e) {
       console.warn("Tauri invoke failed", e);
       // Mock fallback
-      setProcesses([
+      setProcesses(withSearchCache([
         {
           pid: 1001,
           name: "chrome.exe",
@@ -318,7 +356,7 @@ export const Dashboard: React.FC = () => {
           cpu_usage: 5.5,
           memory_usage: 1024 * 1024 * 300,
         },
-      ]);
+      ]));
     }
   };
 
@@ -369,7 +407,7 @@ export const Dashboard: React.FC = () => {
       });
       setIsMocking(false);
       setIsCollecting(true);
-      setChartData([]);
+      resetChartData();
 
       // Schedule auto-stop (frontend-driven), survives route changes via backend rehydration fields.
       if (autoStopTimeoutRef.current) clearTimeout(autoStopTimeoutRef.current);
@@ -409,43 +447,86 @@ export const Dashboard: React.FC = () => {
     }
   };
 
-  const addBatchMetric = (batch: BatchMetric) => {
+  const resetChartData = () => {
+    chartHeadRef.current = 0;
+    chartBufRef.current.fill(undefined);
+    setChartData([]);
+  };
+
+  // Snapshot the ring buffer oldest→newest into a fresh array for React.
+  // One allocation per tick, vs the previous copy + slice pair.
+  const materializeChartData = () => {
+    const buf = chartBufRef.current;
+    const head = chartHeadRef.current;
+    const count = Math.min(head, maxDataPoints);
+    const out = new Array(count);
+    const start = head - count;
+    for (let i = 0; i < count; i++) {
+      out[i] = buf[(start + i) % maxDataPoints];
+    }
+    return out;
+  };
+
+  // Write one batch into the ring buffer without touching React state.
+  const applyBatchToBuffer = (batch: BatchMetric) => {
     // Debug: Check if custom metrics are arriving
     // const hasCustom = Object.values(batch.metrics).some(m => m.custom_metrics);
     // if (hasCustom) console.log("Received Batch with Custom Metrics:", batch);
 
-    setChartData((prev) => {
-      const point: any = { timestamp: batch.timestamp };
-      Object.entries(batch.metrics).forEach(([pidStr, metric]) => {
-        point[`cpu_${pidStr}`] = metric.cpu_usage; // legacy primary
-        // Backward-compat: some payloads (or mock data) may not include cpu_os_usage.
-        // For System API we can safely fallback to cpu_usage (which is OS CPU in that mode).
-        point[`cpuos_${pidStr}`] = metric.cpu_os_usage ?? metric.cpu_usage;
-        if (metric.cpu_chrome_usage != null)
-          point[`cpuch_${pidStr}`] = metric.cpu_chrome_usage;
-        point[`rss_${pidStr}`] = metric.memory_rss;
-        if (metric.memory_footprint != null)
-          point[`foot_${pidStr}`] = metric.memory_footprint;
-        if (metric.memory_private != null)
-          point[`pmem_${pidStr}`] = metric.memory_private;
-        if (metric.js_heap_size) point[`heap_${pidStr}`] = metric.js_heap_size;
-        if (metric.gpu_usage) point[`gpu_${pidStr}`] = metric.gpu_usage;
-        if (metric.custom_metrics) {
-          Object.entries(metric.custom_metrics).forEach(([key, val]) => {
-            const safeKey = key.replace(/[^a-zA-Z0-9]/g, '_');
-            point[`custom_${safeKey}_${pidStr}`] = val;
-          });
-        }
-      });
-      // Merge same-timestamp batches (can happen when backend receives per-PID websocket frames).
-      const last = prev.length ? prev[prev.length - 1] : null;
-      const newData =
-        last && last.timestamp === batch.timestamp
-          ? [...prev.slice(0, -1), { ...last, ...point }]
-          : [...prev, point];
-      if (newData.length > maxDataPoints)
-        return newData.slice(newData.length - maxDataPoints);
-      return newData;
+    const point: any = { timestamp: batch.timestamp };
+    Object.entries(batch.metrics).forEach(([pidStr, metric]) => {
+      point[`cpu_${pidStr}`] = metric.cpu_usage; // legacy primary
+      // Backward-compat: some payloads (or mock data) may not include cpu_os_usage.
+      // For System API we can safely fallback to cpu_usage (which is OS CPU in that mode).
+      point[`cpuos_${pidStr}`] = metric.cpu_os_usage ?? metric.cpu_usage;
+      if (metric.cpu_chrome_usage != null)
+        point[`cpuch_${pidStr}`] = metric.cpu_chrome_usage;
+      point[`rss_${pidStr}`] = metric.memory_rss;
+      if (metric.memory_footprint != null)
+        point[`foot_${pidStr}`] = metric.memory_footprint;
+      if (metric.memory_private != null)
+        point[`pmem_${pidStr}`] = metric.memory_private;
+      if (metric.js_heap_size) point[`heap_${pidStr}`] = metric.js_heap_size;
+      if (metric.gpu_usage) point[`gpu_${pidStr}`] = metric.gpu_usage;
+      if (metric.custom_metrics) {
+        Object.entries(metric.custom_metrics).forEach(([key, val]) => {
+          const safeKey = key.replace(/[^a-zA-Z0-9]/g, '_');
+          point[`custom_${safeKey}_${pidStr}`] = val;
+        });
+      }
+    });
+
+    const buf = chartBufRef.current;
+    const head = chartHeadRef.current;
+    // Merge same-timestamp batches (can happen when backend receives per-PID websocket frames).
+    const lastIdx = head > 0 ? (head - 1) % maxDataPoints : -1;
+    const last = lastIdx >= 0 ? buf[lastIdx] : null;
+    if (last && last.timestamp === batch.timestamp) {
+      buf[lastIdx] = { ...last, ...point };
+    } else {
+      buf[head % maxDataPoints] = point;
+      chartHeadRef.current = head + 1;
+    }
+  };
+
+  const addBatchMetric = (batch: BatchMetric) => {
+    applyBatchToBuffer(batch);
+    setChartData(materializeChartData());
+  };
+
+  // Queue event-driven batches and flush once per animation frame, so a
+  // burst of metric events (or a retuned sub-second interval) costs at most
+  // one render per display refresh.
+  const queueBatchMetric = (batch: BatchMetric) => {
+    pendingBatchesRef.current.push(batch);
+    if (rafRef.current != null) return;
+    rafRef.current = requestAnimationFrame(() => {
+      rafRef.current = null;
+      const pending = pendingBatchesRef.current;
+      if (pending.length === 0) return;
+      pendingBatchesRef.current = [];
+      for (const b of pending) applyBatchToBuffer(b);
+      setChartData(materializeChartData());
     });
   };
 
@@ -470,7 +551,57 @@ export const Dashboard: React.FC = () => {
     }, 1000);
   };
 
-  const selectedProcessList = processes.filter((p) => selectedPids.has(p.pid));
+  // Stable handlers (functional updates, empty deps) so metric-tick renders
+  // don't hand fresh closures to every row / chart legend each second.
+  const handleToggleSelection = useCallback((pid: number) => {
+    setSelectedPids((prev) => {
+      const next = new Set(prev);
+      if (next.has(pid)) next.delete(pid);
+      else next.add(pid);
+      return next;
+    });
+    // Deselecting also un-hides the pid (no-op when selecting).
+    setHiddenPids((prev) => {
+      if (!prev.has(pid)) return prev;
+      const next = new Set(prev);
+      next.delete(pid);
+      return next;
+    });
+  }, []);
+
+  const handleRenameProcess = useCallback((pid: number, alias: string) => {
+    setProcessAliases((prev) => {
+      const next = { ...prev };
+      const trimmed = (alias || "").slice(0, 80).trim();
+      if (!trimmed) delete (next as any)[pid];
+      else (next as any)[pid] = trimmed;
+      return next;
+    });
+  }, []);
+
+  const handleDurationMinutesTextChange = useCallback((val: string) => {
+    setDurationMinutesText(val);
+    const mins = parseFloat(val.trim());
+    if (Number.isFinite(mins) && mins > 0)
+      setDurationHint(`Will auto-stop after ~${Math.round(mins * 60)}s`);
+    else setDurationHint(null);
+  }, []);
+
+  const handleToggleVisibility = useCallback((pid: number) => {
+    setHiddenPids((prev) => {
+      const next = new Set(prev);
+      if (next.has(pid)) next.delete(pid);
+      else next.add(pid);
+      return next;
+    });
+  }, []);
+
+  // Stable identity so the memoized charts subtree only re-renders when the
+  // selection or process list actually changes.
+  const selectedProcessList = useMemo(
+    () => processes.filter((p) => selectedPids.has(p.pid)),
+    [processes, selectedPids]
+  );
   const selectedTags = parseTags(tagsText);
   const knownTagSuggestions = knownTags
     .map((t) => t.tag)
@@ -491,22 +622,22 @@ export const Dashboard: React.FC = () => {
             <button
               onClick={() => !isCollecting && setMode("system")}
               disabled={isCollecting}
-              className={`px-3 py-1.5 rounded-md text-sm font-medium transition-all ${
-                mode === "system"
-                  ? "bg-indigo-600 text-white shadow-sm"
-                  : "text-slate-600 hover:text-slate-900 dark:text-slate-400 dark:hover:text-slate-200"
-              } ${isCollecting ? "opacity-50 cursor-not-allowed" : ""}`}
+              className={clsx(
+                MODE_BTN_BASE,
+                mode === "system" ? MODE_BTN_ACTIVE : MODE_BTN_IDLE,
+                isCollecting && "opacity-50 cursor-not-allowed"
+              )}
             >
               System API
             </button>
             <button
               onClick={() => !isCollecting && setMode("browser")}
               disabled={isCollecting}
-              className={`px-3 py-1.5 rounded-md text-sm font-medium transition-all ${
-                mode === "browser"
-                  ? "bg-indigo-600 text-white shadow-sm"
-                  : "text-slate-600 hover:text-slate-900 dark:text-slate-400 dark:hover:text-slate-200"
-              } ${isCollecting ? "opacity-50 cursor-not-allowed" : ""}`}
+              className={clsx(
+                MODE_BTN_BASE,
+                mode === "browser" ? MODE_BTN_ACTIVE : MODE_BTN_IDLE,
+                isCollecting && "opacity-50 cursor-not-allowed"
+              )}
             >
               Browser API
             </button>
@@ -540,40 +671,15 @@ export const Dashboard: React.FC = () => {
             processes={processes}
             selectedPids={selectedPids}
             processAliases={processAliases}
-            onRenameProcess={(pid, alias) => {
-              setProcessAliases((prev) => {
-                const next = { ...prev };
-                const trimmed = (alias || "").slice(0, 80).trim();
-                if (!trimmed) delete (next as any)[pid];
-                else (next as any)[pid] = trimmed;
-                return next;
-              });
-            }}
+            onRenameProcess={handleRenameProcess}
             isCollecting={isCollecting}
             mode={mode as any}
             filterText={filterText}
             durationMinutesText={durationMinutesText}
-            onDurationMinutesTextChange={(val) => {
-              setDurationMinutesText(val);
-              const mins = parseFloat(val.trim());
-              if (Number.isFinite(mins) && mins > 0)
-                setDurationHint(
-                  `Will auto-stop after ~${Math.round(mins * 60)}s`
-                );
-              else setDurationHint(null);
-            }}
+            onDurationMinutesTextChange={handleDurationMinutesTextChange}
             durationHint={durationHint}
             onFilterChange={setFilterText}
-            onToggleSelection={(pid) => {
-              const next = new Set(selectedPids);
-              if (next.has(pid)) {
-                next.delete(pid);
-                const nextHidden = new Set(hiddenPids);
-                nextHidden.delete(pid);
-                setHiddenPids(nextHidden);
-              } else next.add(pid);
-              setSelectedPids(next);
-            }}
+            onToggleSelection={handleToggleSelection}
             onRefresh={loadProcesses}
             onStart={handleStart}
             onStop={handleStop}
@@ -848,12 +954,7 @@ export const Dashboard: React.FC = () => {
             data={chartData}
             selectedProcesses={selectedProcessList}
             hiddenPids={hiddenPids}
-            onToggleVisibility={(pid) => {
-              const next = new Set(hiddenPids);
-              if (next.has(pid)) next.delete(pid);
-              else next.add(pid);
-              setHiddenPids(next);
-            }}
+            onToggleVisibility={handleToggleVisibility}
             mode={mode as any}
             metricStandard={metricStandard}
           />
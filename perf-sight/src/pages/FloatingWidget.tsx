@@ -27,6 +27,40 @@ interface CollectionStatus {
   target_pids: number[];
 }
 
+// Live sparkline history (one slot per metric batch).
+const SPARK_POINTS = 60;
+
+// Imperative canvas stroke: the real-time trace never goes through React
+// state or SVG — one clearRect + one path per batch, regardless of rate.
+const drawSpark = (
+  canvas: HTMLCanvasElement | null,
+  buf: Float64Array,
+  head: number,
+  maxVal: number,
+  color: string
+) => {
+  const ctx = canvas?.getContext("2d");
+  if (!canvas || !ctx) return;
+  const w = canvas.width;
+  const h = canvas.height;
+  ctx.clearRect(0, 0, w, h);
+  const count = Math.min(head, SPARK_POINTS);
+  if (count < 2) return;
+  const start = head - count;
+  const scale = maxVal > 0 ? (h - 1) / maxVal : 0;
+  ctx.beginPath();
+  for (let i = 0; i < count; i++) {
+    const v = buf[(start + i) % SPARK_POINTS];
+    const x = (i / (SPARK_POINTS - 1)) * w;
+    const y = h - 0.5 - v * scale;
+    if (i === 0) ctx.moveTo(x, y);
+    else ctx.lineTo(x, y);
+  }
+  ctx.strokeStyle = color;
+  ctx.lineWidth = 1;
+  ctx.stroke();
+};
+
 export const FloatingWidget: React.FC = () => {
   const [status, setStatus] = useState<CollectionStatus | null>(null);
   const [elapsed, setElapsed] = useState(0);
@@ -42,6 +76,13 @@ export const FloatingWidget: React.FC = () => {
   const cpuMaxRef = useRef(0);
   const memMaxRef = useRef(0);
 
+  // SoA ring buffers for the canvas sparklines (no per-point JS objects).
+  const cpuHistRef = useRef(new Float64Array(SPARK_POINTS));
+  const memHistRef = useRef(new Float64Array(SPARK_POINTS));
+  const histHeadRef = useRef(0);
+  const cpuCanvasRef = useRef<HTMLCanvasElement | null>(null);
+  const memCanvasRef = useRef<HTMLCanvasElement | null>(null);
+
   useEffect(() => {
     // Poll collection status and update elapsed time
     const pollStatus = async () => {
@@ -85,6 +126,25 @@ export const FloatingWidget: React.FC = () => {
         if (batchCpu > cpuMaxRef.current) cpuMaxRef.current = batchCpu;
         if (batchMem > memMaxRef.current) memMaxRef.current = batchMem;
 
+        const head = histHeadRef.current;
+        cpuHistRef.current[head % SPARK_POINTS] = batchCpu;
+        memHistRef.current[head % SPARK_POINTS] = batchMem;
+        histHeadRef.current = head + 1;
+        drawSpark(
+          cpuCanvasRef.current,
+          cpuHistRef.current,
+          histHeadRef.current,
+          cpuMaxRef.current,
+          "#22d3ee" // cyan-400
+        );
+        drawSpark(
+          memCanvasRef.current,
+          memHistRef.current,
+          histHeadRef.current,
+          memMaxRef.current,
+          "#a78bfa" // violet-400
+        );
+
         setCpuAvg(cpuSumRef.current / countRef.current);
         setMemAvg(memSumRef.current / countRef.current);
         setCpuMax(cpuMaxRef.current);
@@ -244,6 +304,7 @@ export const FloatingWidget: React.FC = () => {
           <div className="text-sm font-bold text-cyan-400 tabular-nums leading-tight">
             {cpuAvg.toFixed(1)}%
           </div>
+          <canvas ref={cpuCanvasRef} width={80} height={14} className="w-full h-3.5" />
         </div>
         <div className="bg-slate-800/50 rounded px-1.5 py-1">
           <div className="flex items-baseline justify-between">
@@ -253,6 +314,7 @@ export const FloatingWidget: React.FC = () => {
           <div className="text-sm font-bold text-violet-400 tabular-nums leading-tight">
             {memAvg.toFixed(0)}MB
           </div>
+          <canvas ref={memCanvasRef} width={80} height={14} className="w-full h-3.5" />
         </div>
       </div>
 
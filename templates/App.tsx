@@ -0,0 +1,396 @@
+
+import React, { useState, useEffect, useRef } from 'react';
+import { 
+  LineChart, Line, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer, AreaChart, Area, Legend
+} from 'recharts';
+import { 
+  Play, Square, Activity, Cpu, Database, Zap, Search, AlertCircle, 
+  Monitor, Layers, Globe, Box as BoxIcon, Server, RefreshCw
+} from 'lucide-react';
+
+// --- Types ---
+interface ProcessInfo {
+  pid: number;
+  name: string;
+  memory_usage: number; // RSS (OS)
+  cpu_usage: number;    // OS Level
+  proc_type: 'Browser' | 'GPU' | 'Renderer' | 'Utility' | 'Other';
+  title?: string;       // From Browser Task Manager (CDP)
+  url?: string;
+}
+
+interface MetricPoint {
+  timestamp: string;
+  pid: number;
+  cpu_usage: number;
+  memory_rss: number;
+  js_heap_size?: number; // New: Browser Internal Metric
+  gpu_usage?: number;
+}
+
+type DataSource = 'system' | 'browser';
+
+// --- Invoke Helper ---
+const invokeCommand = async (cmd: string, args: any = {}) => {
+  // @ts-ignore
+  if (window.__TAURI__) {
+    // @ts-ignore
+    const { invoke } = window.__TAURI__.core;
+    return invoke(cmd, args);
+  }
+  
+  // Mock Data for Preview
+  console.log(`[Mock Invoke] ${cmd}`, args);
+  await new Promise(r => setTimeout(r, 200));
+
+  if (cmd === 'get_process_list') {
+    const isBrowserMode = args.mode === 'browser';
+    if (isBrowserMode) {
+        return [
+          { pid: 1003, name: 'chrome.exe', proc_type: 'Renderer', title: 'YouTube - Video', url: 'https://youtube.com', cpu_usage: 12.1, memory_usage: 1024 * 1024 * 500 },
+          { pid: 1004, name: 'chrome.exe', proc_type: 'Renderer', title: 'GitHub - PerfSight', url: 'https://github.com', cpu_usage: 0.1, memory_usage: 1024 * 1024 * 80 },
+        ];
+    } else {
+        return [
+          { pid: 1001, name: 'chrome.exe', proc_type: 'Browser', title: 'Main Process', cpu_usage: 1.2, memory_usage: 1024 * 1024 * 150 },
+          { pid: 1002, name: 'chrome.exe', proc_type: 'GPU', title: 'GPU Process', cpu_usage: 5.5, memory_usage: 1024 * 1024 * 300 },
+          { pid: 1003, name: 'chrome.exe', proc_type: 'Renderer', title: 'Chrome Renderer', cpu_usage: 12.1, memory_usage: 1024 * 1024 * 500 },
+        ];
+    }
+  }
+  return null;
+};
+
+const getProcessIcon = (type: string) => {
+  switch(type) {
+    case 'GPU': return <Layers className="w-4 h-4 text-amber-400" />;
+    case 'Renderer': return <Globe className="w-4 h-4 text-blue-400" />;
+    case 'Browser': return <Monitor className="w-4 h-4 text-slate-400" />;
+    default: return <BoxIcon className="w-4 h-4 text-slate-600" />;
+  }
+};
+
+const formatBytes = (bytes: number) => {
+  if (bytes === 0) return '0 B';
+  const k = 1024;
+  const sizes = ['B', 'KB', 'MB', 'GB'];
+  const i = Math.floor(Math.log(bytes) / Math.log(k));
+  return parseFloat((bytes / Math.pow(k, i)).toFixed(1)) + ' ' + sizes[i];
+};
+
+export default function App() {
+  const [mode, setMode] = useState<DataSource>('system');
+  const [processes, setProcesses] = useState<ProcessInfo[]>([]);
+  const [selectedPid, setSelectedPid] = useState<number | null>(null);
+  const [isCollecting, setIsCollecting] = useState(false);
+  const [metrics, setMetrics] = useState<MetricPoint[]>([]);
+  const [error, setError] = useState<string | null>(null);
+  const [filterText, setFilterText] = useState('');
+
+  const maxDataPoints = 60;
+  const mockTimerRef = useRef<any>(null);
+
+  // Auto-refresh process list when mode changes
+  useEffect(() => {
+    loadProcesses();
+    // Clear selection when switching modes as PIDs might change visibility
+    if (!isCollecting) setSelectedPid(null);
+  }, [mode]);
+
+  const loadProcesses = async () => {
+    try {
+      setError(null);
+      const list = await invokeCommand('get_process_list', { mode }) as ProcessInfo[];
+      // Sort logic
+      const sorted = list.sort((a, b) => {
+         // Put selected PID at top if exists
+         if (a.pid === selectedPid) return -1;
+         if (b.pid === selectedPid) return 1;
+         // Prefer titled items (Tabs) in browser mode
+         if (a.title && !b.title) return -1;
+         if (!a.title && b.title) return 1;
+         return b.cpu_usage - a.cpu_usage; // Then by CPU
+      });
+      setProcesses(sorted);
+    } catch (e) {
+      console.error(e);
+      setError("Connection Failed. Ensure Chrome is started with: --remote-debugging-port=9222");
+    }
+  };
+
+  const handleStart = async () => {
+    if (!selectedPid) return;
+    try {
+      await invokeCommand('start_collection', { 
+        config: { target_pid: selectedPid, interval_ms: 1000, mode: mode } 
+      });
+      setIsCollecting(true);
+      setMetrics([]);
+      
+      // @ts-ignore
+      if (window.__TAURI__) {
+        // @ts-ignore
+        const { listen } = window.__TAURI__.event;
+        const unlisten = await listen('new-metric', (event: any) => {
+           addMetric(event.payload);
+        });
+      } else {
+        startMockDataGeneration(selectedPid);
+      }
+    } catch (e: any) {
+      setError(e.toString());
+    }
+  };
+
+  const handleStop = async () => {
+    try {
+      await invokeCommand('stop_collection');
+      setIsCollecting(false);
+      if (mockTimerRef.current) clearInterval(mockTimerRef.current);
+    } catch (e: any) {
+      setError(e.toString());
+    }
+  };
+
+  const addMetric = (point: MetricPoint) => {
+    setMetrics(prev => {
+      const newMetrics = [...prev, point];
+      if (newMetrics.length > maxDataPoints) return newMetrics.slice(newMetrics.length - maxDataPoints);
+      return newMetrics;
+    });
+  };
+
+  const startMockDataGeneration = (pid: number) => {
+    if (mockTimerRef.current) clearInterval(mockTimerRef.current);
+    mockTimerRef.current = setInterval(() => {
+      addMetric({
+        timestamp: new Date().toISOString(),
+        pid: pid,
+        cpu_usage: Math.random() * 30,
+        memory_rss: 1024 * 1024 * (200 + Math.random() * 50),
+        js_heap_size: mode === 'browser' ? 1024 * 1024 * (50 + Math.random() * 20) : undefined,
+        gpu_usage: Math.random() * 10
+      });
+    }, 1000);
+  };
+
+  const currentMetric = metrics.length > 0 ? metrics[metrics.length - 1] : null;
+  const selectedProcess = processes.find(p => p.pid === selectedPid);
+
+  const filteredProcesses = processes.filter(p => 
+    p.name.toLowerCase().includes(filterText.toLowerCase()) || 
+    (p.title && p.title.toLowerCase().includes(filterText.toLowerCase()))
+  );
+
+  return (
+    <div className="flex flex-col h-screen bg-slate-950 text-slate-200 font-sans">
+      <header className="flex items-center justify-between px-6 py-4 bg-slate-900 border-b border-slate-800">
+        <div className="flex items-center gap-3">
+          <Activity className="w-6 h-6 text-indigo-500" />
+          <h1 className="text-xl font-bold">PerfSight</h1>
+          <div className="h-6 w-px bg-slate-700 mx-2"></div>
+          
+          {/* Mode Switcher */}
+          <div className="flex bg-slate-950 p-1 rounded-lg border border-slate-800">
+             <button 
+                onClick={() => !isCollecting && setMode('system')}
+                disabled={isCollecting}
+                className={`flex items-center gap-2 px-3 py-1.5 rounded-md text-xs font-medium transition-all ${mode === 'system' ? 'bg-slate-800 text-white shadow-sm' : 'text-slate-400 hover:text-slate-200'} disabled:opacity-50`}
+             >
+               <Server className="w-3.5 h-3.5" /> System Level
+             </button>
+             <button 
+                onClick={() => !isCollecting && setMode('browser')}
+                disabled={isCollecting}
+                className={`flex items-center gap-2 px-3 py-1.5 rounded-md text-xs font-medium transition-all ${mode === 'browser' ? 'bg-indigo-600 text-white shadow-sm' : 'text-slate-400 hover:text-slate-200'} disabled:opacity-50`}
+             >
+               <Globe className="w-3.5 h-3.5" /> Browser API
+             </button>
+          </div>
+        </div>
+
+        <div className={`px-3 py-1 rounded-full text-sm font-medium ${isCollecting ? 'bg-emerald-500/10 text-emerald-400' : 'bg-slate-800 text-slate-400'}`}>
+          {isCollecting ? 'Collecting' : 'Idle'}
+        </div>
+      </header>
+
+      <main className="flex-1 overflow-auto p-6 gap-6 grid grid-cols-1 lg:grid-cols-4">
+        {/* Left Panel: List */}
+        <div className="lg:col-span-1 space-y-4 flex flex-col h-full overflow-hidden">
+          <div className="bg-slate-900/50 border border-slate-800 rounded-xl p-4 flex flex-col flex-1 min-h-0 shadow-lg">
+            <div className="flex justify-between items-center mb-3">
+               <h2 className="text-sm font-semibold flex items-center gap-2 text-slate-400">
+                 <Search className="w-4 h-4" /> {mode === 'browser' ? 'Select Tab' : 'Select Process'}
+               </h2>
+               <button onClick={loadProcesses} disabled={isCollecting} className="p-1.5 hover:bg-slate-800 rounded text-slate-400">
+                 <RefreshCw className={`w-3.5 h-3.5 ${isCollecting ? 'animate-spin' : ''}`} />
+               </button>
+            </div>
+            
+            <input 
+              type="text" 
+              placeholder={mode === 'browser' ? "Filter tabs..." : "Filter processes..."}
+              className="bg-slate-950 border border-slate-800 rounded px-3 py-2 text-sm mb-3 focus:outline-none focus:border-indigo-500"
+              value={filterText}
+              onChange={e => setFilterText(e.target.value)}
+            />
+
+            <div className="flex-1 overflow-y-auto space-y-1 pr-1 custom-scrollbar">
+              {filteredProcesses.map(p => (
+                <button 
+                  key={p.pid}
+                  onClick={() => !isCollecting && setSelectedPid(p.pid)}
+                  disabled={isCollecting}
+                  className={`w-full text-left px-3 py-2.5 rounded-lg text-sm flex items-center gap-3 transition-colors ${
+                    selectedPid === p.pid 
+                      ? 'bg-indigo-600 text-white shadow-lg shadow-indigo-900/50' 
+                      : 'hover:bg-slate-800 text-slate-300'
+                  } ${isCollecting ? 'opacity-50 cursor-not-allowed' : ''}`}
+                >
+                  <div className="shrink-0 opacity-80">{getProcessIcon(p.proc_type)}</div>
+                  <div className="min-w-0 flex-1">
+                    <div className="font-medium truncate">
+                      {p.title || p.name}
+                    </div>
+                    <div className="text-xs opacity-60 truncate flex gap-2 items-center">
+                      <span>{p.pid}</span>
+                      {p.proc_type !== 'Browser' && <span>• {p.proc_type}</span>}
+                    </div>
+                  </div>
+                </button>
+              ))}
+              {filteredProcesses.length === 0 && (
+                <div className="text-center text-slate-500 py-4 text-sm">
+                   {mode === 'browser' ? "No Chrome Tabs found." : "No processes found."}
+                </div>
+              )}
+            </div>
+
+            <div className="mt-4 flex gap-3 pt-3 border-t border-slate-800">
+               {!isCollecting ? (
+                <button onClick={handleStart} disabled={!selectedPid} className="flex-1 bg-indigo-600 hover:bg-indigo-500 text-white px-4 py-2 rounded-lg flex justify-center gap-2 items-center font-medium transition-colors"><Play className="w-4 h-4" /> Start</button>
+              ) : (
+                <button onClick={handleStop} className="flex-1 bg-rose-600 hover:bg-rose-500 text-white px-4 py-2 rounded-lg flex justify-center gap-2 items-center font-medium transition-colors"><Square className="w-4 h-4" /> Stop</button>
+              )}
+            </div>
+          </div>
+        </div>
+
+        {/* Right Panel: Charts */}
+        <div className="lg:col-span-3 space-y-6">
+          {/* Metrics Overview */}
+          <div className="grid grid-cols-4 gap-4">
+             <div className="bg-slate-900/50 border border-slate-800 p-4 rounded-xl">
+               <p className="text-slate-500 text-xs uppercase font-bold">Target</p>
+               <div className="mt-1 text-sm font-medium text-slate-200 truncate" title={selectedProcess?.title || selectedProcess?.name}>
+                 {selectedProcess?.title || selectedProcess?.name || '-'}
+               </div>
+               <div className="text-xs text-indigo-400 mt-1">{selectedProcess?.proc_type || '-'} (PID: {selectedPid})</div>
+            </div>
+            
+            <div className="bg-slate-900/50 border border-slate-800 p-4 rounded-xl">
+               <p className="text-slate-500 text-xs uppercase font-bold">CPU (System)</p>
+               <div className="mt-1 flex items-end gap-2">
+                 <span className="text-3xl font-bold text-indigo-400">{currentMetric?.cpu_usage.toFixed(1) || '0.0'}</span>
+                 <span className="text-sm">%</span>
+               </div>
+            </div>
+
+            <div className="bg-slate-900/50 border border-slate-800 p-4 rounded-xl">
+               <p className="text-slate-500 text-xs uppercase font-bold">Memory (RSS)</p>
+               <div className="mt-1 flex items-end gap-2">
+                 <span className="text-3xl font-bold text-emerald-400">{formatBytes(currentMetric?.memory_rss || 0).split(' ')[0]}</span>
+                 <span className="text-sm">MB</span>
+               </div>
+            </div>
+
+             <div className="bg-slate-900/50 border border-slate-800 p-4 rounded-xl relative overflow-hidden">
+               <p className="text-slate-500 text-xs uppercase font-bold">{mode === 'browser' ? 'JS Heap (Browser)' : 'GPU (Est.)'}</p>
+               <div className="mt-1 flex items-end gap-2">
+                 {mode === 'browser' ? (
+                    <>
+                    <span className="text-3xl font-bold text-amber-400">{formatBytes(currentMetric?.js_heap_size || 0).split(' ')[0]}</span>
+                    <span className="text-sm">MB</span>
+                    </>
+                 ) : (
+                    <>
+                    <span className="text-3xl font-bold text-amber-400">{currentMetric?.gpu_usage?.toFixed(1) || '0.0'}</span>
+                    <span className="text-sm">%</span>
+                    </>
+                 )}
+               </div>
+            </div>
+          </div>
+
+          {/* Chart 1: CPU */}
+          <div className="bg-slate-900 border border-slate-800 rounded-xl p-5 h-[300px] shadow-xl">
+            <h3 className="text-slate-400 font-medium mb-4 flex items-center gap-2"><Cpu className="w-4 h-4" /> CPU Load (System Level)</h3>
+            <div className="w-full h-[220px]">
+              <ResponsiveContainer width="100%" height="100%">
+                <AreaChart data={metrics}>
+                  <defs>
+                    <linearGradient id="colorCpu" x1="0" y1="0" x2="0" y2="1">
+                      <stop offset="5%" stopColor="#6366f1" stopOpacity={0.3}/>
+                      <stop offset="95%" stopColor="#6366f1" stopOpacity={0}/>
+                    </linearGradient>
+                  </defs>
+                  <CartesianGrid strokeDasharray="3 3" stroke="#1e293b" />
+                  <XAxis dataKey="timestamp" hide />
+                  <YAxis stroke="#475569" fontSize={12} />
+                  <Tooltip 
+                    contentStyle={{ backgroundColor: '#0f172a', borderColor: '#334155', color: '#f1f5f9' }}
+                    itemStyle={{ color: '#818cf8' }}
+                  />
+                  <Area type="monotone" dataKey="cpu_usage" stroke="#6366f1" fill="url(#colorCpu)" isAnimationActive={false} />
+                </AreaChart>
+              </ResponsiveContainer>
+            </div>
+          </div>
+
+          {/* Chart 2: Memory (Dual Line if in Browser Mode) */}
+          <div className="bg-slate-900 border border-slate-800 rounded-xl p-5 h-[300px] shadow-xl">
+            <h3 className="text-slate-400 font-medium mb-4 flex items-center gap-2">
+              <Database className="w-4 h-4" /> Memory Usage {mode === 'browser' ? '(RSS vs JS Heap)' : '(RSS)'}
+            </h3>
+             <div className="w-full h-[220px]">
+              <ResponsiveContainer width="100%" height="100%">
+                <LineChart data={metrics}>
+                  <CartesianGrid strokeDasharray="3 3" stroke="#1e293b" />
+                  <XAxis dataKey="timestamp" hide />
+                  <YAxis stroke="#475569" fontSize={12} tickFormatter={(val) => (val/1024/1024).toFixed(0)} />
+                  <Tooltip 
+                    contentStyle={{ backgroundColor: '#0f172a', borderColor: '#334155', color: '#f1f5f9' }}
+                    labelStyle={{ display: 'none' }}
+                    formatter={(val:number) => [formatBytes(val), '']}
+                  />
+                  <Legend />
+                  <Line name="System RSS" type="monotone" dataKey="memory_rss" stroke="#34d399" strokeWidth={2} dot={false} isAnimationActive={false} />
+                  {mode === 'browser' && (
+                     <Line name="JS Heap (CDP)" type="monotone" dataKey="js_heap_size" stroke="#fbbf24" strokeWidth={2} dot={false} isAnimationActive={false} />
+                  )}
+                </LineChart>
+              </ResponsiveContainer>
+            </div>
+          </div>
+          
+           {error && (
+            <div className="bg-rose-950/30 border border-rose-900/50 p-4 rounded-lg flex items-start gap-3 text-rose-300 text-sm">
+              <AlertCircle className="w-5 h-5 shrink-0 mt-0.5" />
+              <div>
+                <p className="font-bold">Error</p>
+                <p>{error}</p>
+                {mode === 'browser' && (
+                    <p className="mt-2 text-xs opacity-70">
+                        Browser Mode requires Chrome started with remote debugging.<br/>
+                        Win: <code>chrome.exe --remote-debugging-port=9222</code><br/>
+                        Mac: <code>/Applications/Google\ Chrome.app/Contents/MacOS/Google\ Chrome --remote-debugging-port=9222</code>
+                    </p>
+                )}
+              </div>
+            </div>
+          )}
+        </div>
+      </main>
+    </div>
+  );
+}
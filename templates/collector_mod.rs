@@ -0,0 +1,158 @@
+
+use crate::models::{MetricPoint, ProcessInfo, CdpTarget};
+use chrono::Utc;
+use sysinfo::{Pid, Process, System};
+use std::collections::HashMap;
+
+pub trait ResourceCollector {
+    fn update(&mut self); 
+    fn scan_processes(&mut self, mode: &str) -> Vec<ProcessInfo>;
+    fn collect_process(&self, pid: u32) -> Option<MetricPoint>;
+}
+
+pub struct GeneralCollector {
+    system: System,
+    // Cache map: PID -> CdpTarget
+    // Used to enrich OS process list with Browser info
+    cdp_map: HashMap<u32, CdpTarget>,
+}
+
+impl GeneralCollector {
+    pub fn new() -> Self {
+        let mut sys = System::new_all();
+        sys.refresh_all();
+        Self { 
+            system: sys,
+            cdp_map: HashMap::new()
+        }
+    }
+
+    // Try to fetch Tab info from Chrome DevTools Protocol
+    // Returns a simple mapping of title/url for heuristics
+    fn fetch_cdp_targets(&self) -> Vec<CdpTarget> {
+        // Use blocking reqwest for simplicity in Phase 1
+        let url = "http://localhost:9222/json/list";
+        match reqwest::blocking::get(url) {
+            Ok(resp) => {
+                if let Ok(targets) = resp.json::<Vec<CdpTarget>>() {
+                    return targets;
+                }
+            },
+            Err(_) => {
+                // CDP not available (Chrome not started with debugging port)
+            }
+        }
+        Vec::new()
+    }
+}
+
+impl ResourceCollector for GeneralCollector {
+    fn update(&mut self) {
+        self.system.refresh_all();
+    }
+
+    fn scan_processes(&mut self, mode: &str) -> Vec<ProcessInfo> {
+        self.system.refresh_processes();
+        
+        let mut results = Vec::new();
+        let targets = if mode == "browser" { self.fetch_cdp_targets() } else { Vec::new() };
+
+        for (pid, process) in self.system.processes() {
+            let name = process.name().to_lowercase();
+            // Match common browser executables
+            let is_chrome_like = name.contains("chrome") || name.contains("edge") || name.contains("safari") || name.contains("firefox");
+            
+            if is_chrome_like {
+                let cmd_args = process.cmd();
+                let args_str = cmd_args.join(" ");
+                
+                let mut p_type = "Browser".to_string();
+                let mut title = None;
+                let mut url = None;
+
+                // 1. Identify Type via Args
+                if args_str.contains("--type=gpu-process") {
+                    p_type = "GPU".to_string();
+                    title = Some("GPU Process".to_string());
+                } else if args_str.contains("--type=renderer") {
+                    p_type = "Renderer".to_string();
+                    title = Some("Renderer / Tab".to_string());
+                } else if args_str.contains("--type=utility") {
+                    p_type = "Utility".to_string();
+                }
+
+                // If in browser mode, and we successfully fetched targets, try to identify tabs
+                if mode == "browser" && !targets.is_empty() {
+                    // NOTE: A robust implementation requires using CDP SystemInfo.getProcessInfo 
+                    // to map PIDs to Tabs correctly. This is a simplified heuristic.
+                    
+                    // We look for a process command line that includes a URL/title that might match
+                    // a CDP target, though this is unreliable across OSes.
+                    
+                    // For the demo, we will prioritize showing the relevant *types* (Renderer, GPU).
+                }
+
+                results.push(ProcessInfo {
+                    pid: pid.as_u32(),
+                    name: name,
+                    memory_usage: process.memory(),
+                    cpu_usage: process.cpu_usage(),
+                    proc_type: p_type,
+                    title: title,
+                    url: url,
+                });
+            }
+        }
+        
+        // Final list in Browser Mode: Show actual Tabs detected via CDP
+        if mode == "browser" && !targets.is_empty() {
+            // Filter targets to only include 'page' type (actual tabs)
+            let tab_targets = targets.into_iter()
+                .filter(|t| t.r#type == "page" && t.webSocketDebuggerUrl.is_some());
+                
+            let mut final_list = Vec::new();
+            
+            // We use the targets to create synthetic entries for tabs 
+            // since we can't reliably map PID from the targets list without a WebSocket connection.
+            // For a running demo, we only show tabs, and use mock PID/metrics.
+            
+            // If we only show CDP targets, we lose OS CPU/Memory.
+            // The best compromise is to show the *System PIDs* but *Prioritize* those with titles.
+            // We return the raw OS data for all Chrome-like processes, and the front-end handles 
+            // prioritizing the display based on `title`.
+        }
+
+        results
+    }
+
+    fn collect_process(&self, pid: u32) -> Option<MetricPoint> {
+        let sys_pid = Pid::from(pid as usize);
+        
+        if let Some(process) = self.system.process(sys_pid) {
+            
+            // In "Browser Mode", we would execute a CDP command here to get JS Heap.
+            // Since this is a prototype, we mock the JS Heap data for processes identified as Renderers/Tabs
+            let _js_heap_mock = if pid % 2 == 0 { Some(1024 * 1024 * 40) } else { None };
+
+            Some(MetricPoint {
+                timestamp: Utc::now(),
+                pid,
+                cpu_usage: process.cpu_usage(), 
+                memory_rss: process.memory(),
+                gpu_usage: None, 
+                // Assign a mock JS Heap size if the process is relevant
+                js_heap_size: if process.name().contains("renderer") { 
+                    Some(process.memory() / 10) // Mock as 10% of RSS
+                } else { 
+                    None 
+                },
+            })
+        } else {
+            None
+        }
+    }
+}
+
+pub fn create_collector() -> Box<dyn ResourceCollector + Send> {
+    Box::new(GeneralCollector::new())
+}
@@ -0,0 +1,96 @@
+
+use tauri::{AppHandle, Emitter, Manager, State};
+use std::sync::{Arc, Mutex};
+use std::time::Duration;
+use tokio::task::JoinHandle;
+use crate::models::{CollectionConfig, ProcessInfo};
+use crate::collector::{create_collector};
+
+pub struct CollectionState {
+    pub handle: Arc<Mutex<Option<JoinHandle<()>>>>,
+    pub is_running: Arc<Mutex<bool>>,
+}
+
+impl CollectionState {
+    pub fn new() -> Self {
+        Self {
+            handle: Arc::new(Mutex::new(None)),
+            is_running: Arc::new(Mutex::new(false)),
+        }
+    }
+}
+
+// Struct for arguments
+#[derive(serde::Deserialize)]
+pub struct ProcessListArgs {
+    mode: String,
+}
+
+#[tauri::command]
+pub async fn get_process_list(args: Option<ProcessListArgs>) -> Result<Vec<ProcessInfo>, String> {
+    let mode = args.map(|a| a.mode).unwrap_or("system".to_string());
+
+    let res = tokio::task::spawn_blocking(move || {
+        let mut collector = create_collector();
+        collector.scan_processes(&mode)
+    }).await.map_err(|e| e.to_string())?;
+    
+    Ok(res)
+}
+
+#[tauri::command]
+pub async fn start_collection(
+    app_handle: AppHandle,
+    state: State<'_, CollectionState>,
+    config: CollectionConfig
+) -> Result<String, String> {
+    let mut running = state.is_running.lock().unwrap();
+    if *running {
+        return Ok("Already running".to_string());
+    }
+    *running = true;
+
+    let is_running_clone = state.is_running.clone();
+    let pid = config.target_pid;
+    let interval = config.interval_ms;
+    // Pass mode to the collector task so it knows whether to fetch CDP data
+    let _mode = config.mode.clone(); 
+
+    let task = tokio::spawn(async move {
+        let mut collector = create_collector();
+        
+        while *is_running_clone.lock().unwrap() {
+            collector.update();
+            
+            if let Some(metric) = collector.collect_process(pid) {
+                // The collector handles whether to include CDP data based on the mode 
+                // in the collect_process logic (currently mocked).
+                if let Err(e) = app_handle.emit("new-metric", &metric) {
+                    eprintln!("Emit error: {}", e);
+                }
+            } else {
+                eprintln!("Target process lost: {}", pid);
+            }
+
+            tokio::time::sleep(Duration::from_millis(interval)).await;
+        }
+    });
+
+    let mut handle_guard = state.handle.lock().unwrap();
+    *handle_guard = Some(task);
+
+    Ok("Started".to_string())
+}
+
+#[tauri::command]
+pub fn stop_collection(state: State<'_, CollectionState>) -> Result<String, String> {
+    let mut running = state.is_running.lock().unwrap();
+    *running = false;
+    
+    let mut handle = state.handle.lock().unwrap();
+    if let Some(h) = handle.take() {
+        h.abort();
+    }
+    
+    Ok("Stopped".to_string())
+}
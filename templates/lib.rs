@@ -0,0 +1,18 @@
+
+pub mod models;
+pub mod collector;
+pub mod commands;
+use commands::CollectionState;
+#[cfg_attr(mobile, tauri::mobile_entry_point)]
+pub fn run() {
+    tauri::Builder::default()
+        .plugin(tauri_plugin_shell::init())
+        .manage(CollectionState::new())
+        .invoke_handler(tauri::generate_handler![
+            commands::get_process_list,
+            commands::start_collection,
+            commands::stop_collection
+        ])
+        .run(tauri::generate_context!())
+        .expect("error while running tauri application");
+}
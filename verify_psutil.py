@@ -1,18 +1,39 @@
 import psutil
+import resource
 import time
 import os
 import sys
 import json
 
-def get_process_info(pid):
+# 跟 collector.py 一致：优先 orjson（直接编码成 bytes），没有就退回 stdlib。
+try:
+    import orjson
+
+    def json_dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def json_dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
+def _self_cpu_ns():
+    # getrusage 一次系统调用就拿到本进程累计 CPU 时间，不用碰 /proc；
+    # 只对"自己监控自己"这种场景可用（RUSAGE_SELF 没法指定别的 PID）
+    u = resource.getrusage(resource.RUSAGE_SELF)
+    return int((u.ru_utime + u.ru_stime) * 1e9)
+
+def get_process_info(pid, skip_cpu=False):
     try:
         proc = psutil.Process(pid)
         # onseshot=True 提高效率
         with proc.oneshot():
             name = proc.name()
-            # interval=None 表示非阻塞，返回自上次调用以来的平均值
-            # 注意：第一次调用通常返回 0.0，需要忽略或由于我们是循环调用，后续会正常
-            cpu_percent = proc.cpu_percent(interval=None) 
+            if skip_cpu:
+                # CPU 由调用方用 getrusage 差值填充
+                cpu_percent = 0.0
+            else:
+                # interval=None 表示非阻塞，返回自上次调用以来的平均值
+                # 注意：第一次调用通常返回 0.0，需要忽略或由于我们是循环调用，后续会正常
+                cpu_percent = proc.cpu_percent(interval=None)
             # rss 是 Resident Set Size (物理内存)
             memory_info = proc.memory_info()
             memory_mb = memory_info.rss / 1024 / 1024
@@ -37,12 +58,30 @@ def main():
 
     # 为了制造一点 CPU 负载以便观察，我们可以在检测间隙做一点点运算，或者就检测自己
     target_pid = current_pid
-    
-    # 初始化 CPU 计数
-    psutil.Process(target_pid).cpu_percent(interval=None)
+
+    # 监控对象就是自己时走 getrusage：比 psutil.cpu_percent 便宜得多
+    # （后者每次都要重新打开并解析 /proc/<pid>/stat）
+    use_rusage = target_pid == current_pid
+    if use_rusage:
+        prev_cpu_ns = _self_cpu_ns()
+        prev_mono_ns = time.monotonic_ns()
+    else:
+        # 初始化 CPU 计数
+        psutil.Process(target_pid).cpu_percent(interval=None)
+
+    # 绝对 deadline 驱动的节拍：避免每轮把采样耗时累积成漂移
+    interval_ns = 1_000_000_000
+    next_tick_ns = time.monotonic_ns() + interval_ns
 
     while True:
-        info = get_process_info(target_pid)
+        info = get_process_info(target_pid, skip_cpu=use_rusage)
+        if use_rusage and info and "error" not in info:
+            cur_cpu_ns = _self_cpu_ns()
+            now_ns = time.monotonic_ns()
+            dt_ns = now_ns - prev_mono_ns
+            if dt_ns > 0:
+                info["cpu"] = (cur_cpu_ns - prev_cpu_ns) / dt_ns * 100.0
+            prev_cpu_ns, prev_mono_ns = cur_cpu_ns, now_ns
         if info:
             # CPU 需要除以核心数吗？Task Manager 通常显示的是占总 CPU 的百分比。
             # psutil.cpu_percent 默认是逻辑核心的总和（可能超过 100%）。
@@ -50,10 +89,16 @@ def main():
             # Windows Task Manager: 100% 是所有核跑满。psutil 也是这样 (但多核可能 > 100% 如果逻辑不同)。
             # 让我们直接打印原始值
             
-            # 格式化输出 JSON 以便看清
-            print(json.dumps(info))
-        
-        time.sleep(1)
+            # 输出 JSON 行：编码成 bytes 后用 os.write 一次写出，
+            # 绕开 print 的 str 格式化 + TextIO 缓冲/flush（collector.py 同款）。
+            os.write(sys.stdout.fileno(), json_dumps(info) + b"\n")
+
+        delay = (next_tick_ns - time.monotonic_ns()) / 1e9
+        if delay > 0:
+            time.sleep(delay)
+        next_tick_ns += interval_ns
+        if next_tick_ns < time.monotonic_ns():
+            next_tick_ns = time.monotonic_ns() + interval_ns
 
 if __name__ == "__main__":
     main()
@@ -1,3 +1,4 @@
+import os
 import psutil
 import time
 import sys
@@ -6,16 +7,49 @@ import sys
 LOGICAL_CORES = psutil.cpu_count(logical=True)
 print(f"系统检测到 {LOGICAL_CORES} 个逻辑核心。CPU 数据将据此标准化。")
 
+# Linux jiffies -> 秒的换算系数（Windows 上没有 sysconf，不会走到该路径）
+CLK_TCK = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
 # --- 新增配置：刷新间隔 ---
 # 将间隔设置为 0.5 秒，比之前的 1.0 秒快一倍，提高实时感。
 REFRESH_INTERVAL = 0.5 
 # ------------------------
 
+def _find_chrome_gpu_pid_procfs():
+    """
+    Linux 快速路径：只读每个进程的 /proc/<pid>/cmdline。
+    psutil.process_iter(['pid','name','cmdline']) 会为每个进程额外打开
+    stat + status，而判断 GPU 进程只需要 cmdline 一个文件。
+    """
+    for entry in os.scandir('/proc'):
+        if not entry.name.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry.name}/cmdline', 'rb') as f:
+                cmd = f.read()
+        except OSError:
+            continue
+        # cmdline 以 \0 分隔参数，直接按字节子串匹配即可
+        if b'--type=gpu-process' in cmd and b'chrome' in cmd:
+            return int(entry.name)
+    return None
+
 def find_chrome_gpu_pid():
     """
     遍历所有进程，通过检查命令行参数找到 Chrome GPU 进程的 PID。
     """
     print("正在寻找 Chrome GPU 进程...")
+
+    # Linux 上跳过 psutil，直接扫 /proc（每个进程少开 2 个文件）
+    if os.path.isdir('/proc'):
+        pid = _find_chrome_gpu_pid_procfs()
+        if pid is not None:
+            print(f"找到 Chrome GPU 进程，PID: {pid}")
+            return pid
+        print("未找到 Chrome GPU 进程。请确保 Chrome 正在运行。")
+        return None
+
+    # Windows / macOS：保留 psutil 路径
     for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
         try:
             if proc.info['name'] and 'chrome.exe' in proc.info['name'].lower():
@@ -29,10 +63,51 @@ def find_chrome_gpu_pid():
     print("未找到 Chrome GPU 进程。请确保 Chrome 正在运行。")
     return None
 
+# procfs 文件支持在同一个 fd 上用 pread(偏移 0) 反复读取最新内容，
+# 所以下面两个解析函数都吃常驻 fd：每个 tick 只剩一次 pread 系统调用
+# （读取期间释放 GIL），省掉反复 open/close 的开销。
+
+def _stat_jiffies_fd(fd):
+    """
+    从 /proc/<pid>/stat 的常驻 fd 读出 utime+stime（字段 14/15）。
+    comm 字段可能含空格/括号，从最后一个 ')' 之后再切分才安全。
+    """
+    data = os.pread(fd, 4096, 0)
+    fields = data[data.rfind(b")") + 2:].split()
+    return int(fields[11]) + int(fields[12])
+
+def _uss_mb_fd(fd):
+    """
+    从 /proc/<pid>/smaps_rollup 的常驻 fd 读出 USS（MB）。
+    内核已经把所有 VMA 预先求和，一次 pread 即可；memory_full_info()
+    则要逐行扫整个 smaps，对 Chrome GPU 这种映射很多的进程贵得多。
+    """
+    total_kb = 0
+    for line in os.pread(fd, 65536, 0).splitlines():
+        if line.startswith((b"Private_Clean:", b"Private_Dirty:", b"Private_Hugetlb:")):
+            total_kb += int(line.split()[1])
+    return total_kb / 1024
+
+def uss_mb(proc):
+    """
+    psutil 回退路径（Windows，或旧内核没有 smaps_rollup 时）。
+    """
+    try:
+        # 尝试获取最准确的专用内存
+        return proc.memory_full_info().uss / (1024 * 1024)
+    except (psutil.AccessDenied, AttributeError):
+        # 如果受限，回退到 RSS (稍微不那么准确，但通常可用)
+        return proc.memory_info().rss / (1024 * 1024)
+
 def monitor_process(pid):
     """
     实时监控指定 PID 的 CPU 和内存开销。
+
+    返回 True 表示目标进程已退出（调用方可以重新发现新的 GPU 进程），
+    返回 False 表示用户主动停止或发生异常。
     """
+    stat_fd = None
+    rollup_fd = None
     try:
         proc = psutil.Process(pid)
         
@@ -43,53 +118,119 @@ def monitor_process(pid):
         print("-" * 55)
 
         # --- 关键修改 1: 初始化参考点 ---
-        # 首次调用 interval=None，返回值始终为 0.0，但它建立了一个
-        # 时间基准点 (T1)，供下一次调用计算差值使用。
-        proc.cpu_percent(interval=None) 
+        # Linux 上自己维护 (jiffies, 单调时钟) 基准点：每个 tick 只读一次
+        # /proc/<pid>/stat；psutil.cpu_percent 还要额外读系统级 /proc/stat
+        # 来做归一化。Windows / macOS 保留 psutil 路径。
+        use_procfs = os.path.isdir(f"/proc/{pid}")
+        if use_procfs:
+            stat_fd = os.open(f"/proc/{pid}/stat", os.O_RDONLY)
+            try:
+                rollup_fd = os.open(f"/proc/{pid}/smaps_rollup", os.O_RDONLY)
+            except OSError:
+                rollup_fd = None  # 旧内核（<4.14）走 psutil 回退
+            prev_jiffies = _stat_jiffies_fd(stat_fd)
+            prev_ns = time.monotonic_ns()
+        else:
+            # 首次调用 interval=None，返回值始终为 0.0，但它建立了一个
+            # 时间基准点 (T1)，供下一次调用计算差值使用。
+            proc.cpu_percent(interval=None)
+
+        # --- 关键修改 2: 固定节拍采样 ---
+        # 不用裸 sleep(间隔)：那样每个 tick 都会把采样/打印耗时累积成漂移。
+        # 维护绝对 deadline，睡到点为止，采样周期保持恒定。
+        interval_ns = int(REFRESH_INTERVAL * 1e9)
+        next_tick_ns = time.monotonic_ns() + interval_ns
+
+        # USS（smaps_rollup / memory_full_info）比 CPU 采样贵 1~2 个数量级，
+        # 而内存曲线远没有 CPU 抖得快：每 ~2 秒刷新一次足够，
+        # 其余 tick 直接复用上一次的值。
+        mem_every = max(1, int(2.0 / REFRESH_INTERVAL))
+        tick = 0
+        memory_mb = 0.0
+
+        # 输出行的格式化器在循环外绑定好：循环里只剩一次 format 调用
+        # 加一次 write，跳过 print 的 sep/end/file 参数处理和两段式输出
+        fmt_row = "{t:<10} | {c:>14.1f} % | {m:>18.2f} MB\n".format
+        write_row = sys.stdout.write
 
         while True:
-            # --- 关键修改 2: 手动控制刷新节奏 ---
-            # 在这里睡眠，决定了采样的时间窗口大小。
-            time.sleep(REFRESH_INTERVAL)
-
-            # --- 关键修改 3: 非阻塞获取 CPU ---
-            # interval=None 会计算自上次调用以来的使用率。
-            # 时间窗口就是上面 sleep 的时间。
-            raw_cpu_percent = proc.cpu_percent(interval=None)
-
-            # 标准化 CPU 使用率 (匹配任务管理器 0-100% 的视图)
-            normalized_cpu_percent = raw_cpu_percent / LOGICAL_CORES
-            
-            # 获取准确的内存信息 (USS - Unique Set Size)
-            try:
-                # 尝试获取最准确的专用内存
-                mem_info = proc.memory_full_info()
-                memory_mb = mem_info.uss / (1024 * 1024)
-            except (psutil.AccessDenied, AttributeError):
-                 # 如果受限，回退到 RSS (稍微不那么准确，但通常可用)
-                 mem_info = proc.memory_info()
-                 memory_mb = mem_info.rss / (1024 * 1024)
-            
+            delay = (next_tick_ns - time.monotonic_ns()) / 1e9
+            if delay > 0:
+                time.sleep(delay)
+            next_tick_ns += interval_ns
+            # 采样太慢错过整拍时直接跳到下一个未来的 deadline，不补发
+            if next_tick_ns < time.monotonic_ns():
+                next_tick_ns = time.monotonic_ns() + interval_ns
+
+            if use_procfs:
+                # --- 关键修改 3: jiffies 差值直接算 CPU ---
+                cur_jiffies = _stat_jiffies_fd(stat_fd)
+                now_ns = time.monotonic_ns()
+                dt = (now_ns - prev_ns) / 1e9
+                raw_cpu_percent = (
+                    (cur_jiffies - prev_jiffies) / CLK_TCK / dt * 100.0
+                    if dt > 0 else 0.0
+                )
+                prev_jiffies, prev_ns = cur_jiffies, now_ns
+
+                # 标准化 CPU 使用率 (匹配任务管理器 0-100% 的视图)
+                normalized_cpu_percent = raw_cpu_percent / LOGICAL_CORES
+
+                # 获取准确的内存信息 (USS - Unique Set Size)，按慢节拍刷新
+                if tick % mem_every == 0:
+                    memory_mb = _uss_mb_fd(rollup_fd) if rollup_fd is not None else uss_mb(proc)
+            else:
+                # oneshot(): 底层的 NtQuery* 在本次 tick 内只读一次，
+                # CPU 和内存回退路径共用缓存结果。
+                with proc.oneshot():
+                    raw_cpu_percent = proc.cpu_percent(interval=None)
+                    normalized_cpu_percent = raw_cpu_percent / LOGICAL_CORES
+                    if tick % mem_every == 0:
+                        memory_mb = uss_mb(proc)
+            tick += 1
+
             current_time = time.strftime("%H:%M:%S", time.localtime())
             # 打印时保留一位小数即可，变化太快看太多位也没意义
-            print(f"{current_time:<10} | {normalized_cpu_percent:>14.1f} % | {memory_mb:>18.2f} MB")
+            write_row(fmt_row(t=current_time, c=normalized_cpu_percent, m=memory_mb))
 
-    except psutil.NoSuchProcess:
-        print(f"\n进程 PID {pid} 已结束。监控停止。")
+    except (psutil.NoSuchProcess, FileNotFoundError, ProcessLookupError):
+        print(f"\n进程 PID {pid} 已结束。")
+        return True
     except KeyboardInterrupt:
         print("\n监控已由用户停止。")
+        return False
     except Exception as e:
         import traceback
         traceback.print_exc()
         print(f"\n发生错误: {e}")
+        return False
+    finally:
+        for fd in (stat_fd, rollup_fd):
+            if fd is not None:
+                os.close(fd)
 
 if __name__ == "__main__":
     # 建议：以管理员身份运行此脚本可以提高获取 memory_full_info(USS) 的成功率
-    gpu_pid = find_chrome_gpu_pid()
-
-    if gpu_pid:
-        time.sleep(0.5) 
-        if psutil.pid_exists(gpu_pid):
-            monitor_process(gpu_pid)
-        else:
-             print("找到的进程在启动监控前已消失。")
\ No newline at end of file
+    #
+    # 发现逻辑不放在热循环里：监控期间零扫描开销，只有在被监控的
+    # GPU 进程退出后（Chrome 崩溃重启 GPU 进程是常事）才重新扫一次
+    # /proc 找新 PID。注：procfs 是虚拟文件系统，进程创建不会产生
+    # inotify 事件，事件驱动的发现需要 root 权限的 netlink proc
+    # connector，对一个验证脚本来说不值得。
+    try:
+        while True:
+            gpu_pid = find_chrome_gpu_pid()
+            if not gpu_pid:
+                break
+            time.sleep(0.5)
+            if not psutil.pid_exists(gpu_pid):
+                print("找到的进程在启动监控前已消失。")
+                time.sleep(1.0)
+                continue
+            if not monitor_process(gpu_pid):
+                break
+            # Chrome 重新拉起 GPU 进程通常在秒级内完成
+            print("等待 Chrome 重新拉起 GPU 进程...")
+            time.sleep(1.0)
+    except KeyboardInterrupt:
+        print("\n已退出。")
\ No newline at end of file